@@ -0,0 +1,99 @@
+import argparse
+import gc
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from spypointapi.cameras.camera import Camera
+from spypointapi.cameras.camera_api_response import CameraApiResponse
+from spypointapi.cameras.lazy_camera import LazyCameraApiResponse
+from spypointapi.cameras.subscription_api_response import SubscriptionApiResponse
+from .fleet_generator import FleetGenerator
+
+
+def baseline_datetime_from_json(date_str: str | None) -> datetime | None:
+    if not date_str:
+        return None
+    current_timezone = datetime.now().astimezone().tzinfo
+    return datetime.fromisoformat(date_str.rstrip('Z')).replace(tzinfo=current_timezone)
+
+
+def baseline_camera_from_json(data: Dict[str, Any]) -> Camera:
+    # the parser as it was before batch parsing: the timezone resolved for every date, no context, no interning
+    config = data.get('config', {})
+    status = data.get('status', {})
+    subscription = SubscriptionApiResponse.subscription_from_json(data.get('subscriptions'))
+    return Camera(
+        id=data['id'],
+        name=config['name'],
+        model=status['model'],
+        modem_firmware=status.get('modemFirmware', ''),
+        camera_firmware=status.get('version', ''),
+        last_update_time=datetime.fromisoformat(status['lastUpdate'][:-1]).replace(
+            tzinfo=datetime.now().astimezone().tzinfo),
+        signal=status.get('signal', {}).get('processed', {}).get('percentage', None),
+        temperature=CameraApiResponse.temperature_from_json(status.get('temperature', None)),
+        battery=CameraApiResponse.battery_from_json(status.get('batteries', None)),
+        battery_type=status.get('batteryType', None),
+        memory=CameraApiResponse.memory_from_json(status.get('memory', None)),
+        notifications=CameraApiResponse.notifications_from_json(status.get('notifications', None)),
+        owner=CameraApiResponse.owner_from_json(data),
+        coordinates=CameraApiResponse.coordinates_from_json(status.get('coordinates', None)),
+        activation_date=baseline_datetime_from_json(data.get('activationDate')),
+        creation_date=baseline_datetime_from_json(data.get('creationDate')),
+        is_cellular=data.get('isCellular', data.get('cellular', None)),
+        capture_mode=config.get('captureMode', None),
+        delay=config.get('delay', None),
+        multi_shot=config.get('multiShot', None),
+        quality=config.get('quality', None),
+        operation_mode=config.get('operationMode', None),
+        sensibility=config.get('sensibility', {}).get('level', None),
+        transmit_auto=config.get('transmitAuto', None),
+        transmit_format=config.get('transmitFormat', None),
+        transmit_freq=config.get('transmitFreq', None),
+        transmit_time=CameraApiResponse.transmit_time_from_json(config.get('transmitTime', None)),
+        trigger_speed=config.get('triggerSpeed', None),
+        photo_count=subscription.photoCount,
+        photo_limit=subscription.photoLimit,
+        hd_photo_count=subscription.hdPhotoCount,
+        hd_photo_limit=subscription.hdPhotoLimit,
+    )
+
+
+def best_time(parse: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        parse()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare parsing /camera/all payloads with the previous parser.')
+    parser.add_argument('--cameras', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    data: List[Dict[str, Any]] = FleetGenerator(args.seed).cameras(args.cameras)
+    assert CameraApiResponse.from_json(data) == [baseline_camera_from_json(d) for d in data]
+
+    baseline = best_time(lambda: [baseline_camera_from_json(d) for d in data], args.repeat)
+    per_camera = best_time(lambda: [CameraApiResponse.camera_from_json(d) for d in data], args.repeat)
+    batch = best_time(lambda: CameraApiResponse.from_json(data), args.repeat)
+    lazy = best_time(lambda: [(c.id, c.battery, c.signal, c.is_online) for c in LazyCameraApiResponse.from_json(data)],
+                     args.repeat)
+
+    print(f"cameras={args.cameras}")
+    print(f"baseline:   {baseline * 1000:.1f} ms ({baseline / args.cameras * 1e6:.2f} us/camera)")
+    print(f"per-camera: {per_camera * 1000:.1f} ms ({per_camera / args.cameras * 1e6:.2f} us/camera)")
+    print(f"batch:      {batch * 1000:.1f} ms ({batch / args.cameras * 1e6:.2f} us/camera)")
+    print(f"speedup:    {baseline / batch:.2f}x over baseline")
+    print(f"lazy, reading id/battery/signal/is_online: "
+          f"{lazy * 1000:.1f} ms ({lazy / args.cameras * 1e6:.2f} us/camera)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import Any, Callable, List
+
+from spypointapi.cameras.camera import Camera
+from spypointapi.cameras.camera_api_response import CameraApiResponse
+from .fleet_generator import FleetGenerator
+
+# the models as they were before slots and interning: one __dict__ per instance and one string per camera
+DictCoordinates = make_dataclass('Coordinates', ['latitude', 'longitude'])
+DictTransmitTime = make_dataclass('TransmitTime', ['hour', 'minute'])
+DictCamera = make_dataclass('Camera', [camera_field.name for camera_field in fields(Camera)])
+
+
+INTERNED_FIELDS = {'model', 'modem_firmware', 'camera_firmware', 'battery_type', 'capture_mode', 'quality',
+                   'operation_mode', 'sensibility', 'transmit_format', 'trigger_speed'}
+
+
+def decoded_copy(value: Any) -> Any:
+    # a distinct string object, as json.loads produces for each occurrence
+    return value.encode().decode() if type(value) is str else value
+
+
+def dict_camera(camera: Camera) -> DictCamera:
+    values = {camera_field.name: getattr(camera, camera_field.name) for camera_field in fields(Camera)}
+    for name in INTERNED_FIELDS:
+        values[name] = decoded_copy(values[name])
+    if camera.coordinates is not None:
+        values['coordinates'] = DictCoordinates(camera.coordinates.latitude, camera.coordinates.longitude)
+    if camera.transmit_time is not None:
+        values['transmit_time'] = DictTransmitTime(camera.transmit_time.hour, camera.transmit_time.minute)
+    return DictCamera(**values)
+
+
+def bytes_per_camera(build: Callable[[], List[Any]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cameras = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(cameras)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure memory held per parsed camera.')
+    parser.add_argument('--cameras', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    data = json.loads(json.dumps(FleetGenerator(args.seed).cameras(args.cameras)))
+    cameras = CameraApiResponse.from_json(data)
+
+    before = bytes_per_camera(lambda: [dict_camera(camera) for camera in cameras])
+    after = bytes_per_camera(lambda: CameraApiResponse.from_json(data))
+
+    print(f"cameras={args.cameras}")
+    print(f"dict-based models:     {before:.0f} bytes/camera")
+    print(f"slotted, interned:     {after:.0f} bytes/camera")
+    print(f"saved:                 {before - after:.0f} bytes/camera ({(before - after) / before:.0%})")
+
+
+if __name__ == '__main__':
+    main()
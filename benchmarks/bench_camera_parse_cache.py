@@ -0,0 +1,82 @@
+import argparse
+import copy
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from spypointapi import CameraParseCache
+from spypointapi.cameras.camera_api_response import CameraApiResponse
+from .fleet_generator import FleetGenerator
+
+
+def cached_poll(previous: List[Dict[str, Any]], poll: List[Dict[str, Any]]) -> float:
+    # the cache is warmed with the previous poll so only this poll's changes are parsed again
+    cache = CameraParseCache()
+    cache.from_json(previous)
+    started = time.perf_counter()
+    cameras = cache.from_json(poll)
+    elapsed = time.perf_counter() - started
+    assert cameras == CameraApiResponse.from_json(poll)
+    return elapsed
+
+
+def bytes_per_camera(parse: Callable[[List[Dict[str, Any]]], Any], body: bytes, count: int) -> float:
+    # the body is decoded inside the measurement, whatever the parser keeps of the payload is counted
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = parse(json.loads(body))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+def warm_cache(poll: List[Dict[str, Any]]) -> CameraParseCache:
+    cache = CameraParseCache()
+    cache.from_json(poll)
+    return cache
+
+
+def full_parse(data: List[Dict[str, Any]]) -> float:
+    started = time.perf_counter()
+    CameraApiResponse.from_json(data)
+    return time.perf_counter() - started
+
+
+def changed(data: List[Dict[str, Any]], every: int) -> List[Dict[str, Any]]:
+    # a fresh decode of the next poll, where one camera out of every reports a new status
+    poll = copy.deepcopy(data)
+    for camera in poll[::every] if every else []:
+        camera['status']['lastUpdate'] = '2024-11-01T00:00:00.000Z'
+    return poll
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare polls through CameraParseCache with full re-parses.')
+    parser.add_argument('--cameras', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    data: List[Dict[str, Any]] = FleetGenerator(args.seed).cameras(args.cameras)
+    full = min(full_parse(data) for _ in range(args.repeat))
+    body = json.dumps(data).encode()
+    parsed_bytes = bytes_per_camera(CameraApiResponse.from_json, body, args.cameras)
+    cached_bytes = bytes_per_camera(warm_cache, body, args.cameras)
+
+    print(f"cameras={args.cameras}")
+    print(f"retained:               {parsed_bytes:7.0f} bytes/camera parsed, "
+          f"{cached_bytes:.0f} bytes/camera in the cache")
+    print(f"full parse:             {full * 1000:7.1f} ms ({full / args.cameras * 1e6:.2f} us/camera)")
+    for every, label in ((0, 'unchanged'), (100, '1% changed'), (10, '10% changed')):
+        cached = min(cached_poll(data, changed(data, every)) for _ in range(args.repeat))
+        print(f"cached poll, {label + ':':<11} {cached * 1000:7.1f} ms ({cached / args.cameras * 1e6:.2f} us/camera, "
+              f"{full / cached:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import json
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from benchmarks.bench_camera_api_response import best_time
+from benchmarks.fleet_generator import FleetGenerator
+from spypointapi.json_decoder import orjson, stdlib_json_decoder
+
+
+def text_then_json(body: bytes) -> Any:
+    # previous path: response.text() for the debug log, then response.json() decoding the body to str once more
+    body.decode('utf-8')
+    return json.loads(body.decode('utf-8'))
+
+
+def peak_memory(decode: Callable[[bytes], Any], body: bytes) -> int:
+    tracemalloc.start()
+    try:
+        decode(body)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare JSON decoders on a /camera/all payload.')
+    parser.add_argument('--cameras', type=int, default=5_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    body = json.dumps(FleetGenerator(args.seed).cameras(args.cameras)).encode()
+    decoders: Dict[str, Callable[[bytes], Any]] = {
+        'text then json': text_then_json,
+        'json from bytes': stdlib_json_decoder,
+    }
+    if orjson is not None:
+        decoders['orjson from bytes'] = orjson.loads
+
+    print(f"cameras={args.cameras} payload={len(body) / 1024 / 1024:.1f} MiB")
+    for name, decode in decoders.items():
+        elapsed = best_time(lambda: decode(body), args.repeat)
+        print(f"{name:<18} {elapsed * 1000:7.1f} ms  peak {peak_memory(decode, body) / 1024 / 1024:6.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+from benchmarks.fleet_generator import FleetGenerator
+from spypointapi.cameras.camera_api_response import CameraApiResponse, CameraParseContext
+from spypointapi.json_stream import JsonArrayStream
+
+
+def buffered(body: bytes, chunk_size: int) -> int:
+    return len(CameraApiResponse.from_json(json.loads(body)))
+
+
+def streamed(body: bytes, chunk_size: int) -> int:
+    # stand-in for a consumer that handles each camera and drops it
+    context = CameraParseContext()
+    stream = JsonArrayStream()
+    count = 0
+    for start in range(0, len(body), chunk_size):
+        for data in stream.feed(body[start:start + chunk_size]):
+            CameraApiResponse.camera_from_json(data, context)
+            count += 1
+    return count + len(stream.close())
+
+
+def measure(parse: Callable[[bytes, int], int], body: bytes, chunk_size: int) -> str:
+    started = time.perf_counter()
+    parse(body, chunk_size)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        parse(body, chunk_size)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return f"{elapsed * 1000:7.1f} ms  peak {peak / 1024 / 1024:6.1f} MiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare buffered and streamed parsing of /camera/all.')
+    parser.add_argument('--cameras', type=int, default=10_000)
+    parser.add_argument('--chunk-size', type=int, default=64 * 1024)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    body = json.dumps(FleetGenerator(args.seed).cameras(args.cameras)).encode()
+    assert streamed(body, args.chunk_size) == buffered(body, args.chunk_size) == args.cameras
+
+    print(f"cameras={args.cameras} payload={len(body) / 1024 / 1024:.1f} MiB chunk={args.chunk_size} bytes")
+    print(f"buffered: {measure(buffered, body, args.chunk_size)}")
+    print(f"streamed: {measure(streamed, body, args.chunk_size)}")
+
+
+if __name__ == '__main__':
+    main()
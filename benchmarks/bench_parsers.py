@@ -0,0 +1,62 @@
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from spypointapi.cameras.camera_api_response import CameraApiResponse
+from spypointapi.cameras.subscription_api_response import SubscriptionApiResponse
+from spypointapi.shared_cameras.shared_cameras_api_response import SharedCamerasApiResponse
+from .fleet_generator import FleetGenerator
+
+
+def measure(parse: Callable[[], Any], count: int, repeat: int) -> str:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        parse()
+        times.append(time.perf_counter() - started)
+
+    # blocks still held by the result, and the peak while parsing
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = parse()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    retained = sys.getallocatedblocks() - blocks
+    del result
+
+    return (f"{min(times) / count * 1e6:7.2f} us/camera  {retained / count:6.1f} blocks/camera  "
+            f"peak {peak / count:7.0f} bytes/camera")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse time and allocations per camera for generated fleets.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    fleet = FleetGenerator(args.seed)
+    for size in args.sizes:
+        data: List[Dict[str, Any]] = fleet.cameras(size)
+        subscriptions = [camera.get('subscriptions') for camera in data]
+        shared = fleet.shared_cameras([camera['id'] for camera in data])
+
+        parsers: Dict[str, Callable[[], Any]] = {
+            'CameraApiResponse.from_json': lambda: CameraApiResponse.from_json(data),
+            'SubscriptionApiResponse.subscription_from_json':
+                lambda: [SubscriptionApiResponse.subscription_from_json(s) for s in subscriptions],
+            'SharedCamerasApiResponse.from_json': lambda: SharedCamerasApiResponse.from_json(shared),
+        }
+
+        print(f"cameras={size}")
+        for name, parse in parsers.items():
+            print(f"  {name:<48} {measure(parse, size, args.repeat)}")
+
+
+if __name__ == '__main__':
+    main()
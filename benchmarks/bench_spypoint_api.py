@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import timedelta
+from typing import List
+
+from spypointapi import RetryPolicy, SpypointApi
+from .stand_in_server import StandInOptions, StandInServer
+
+
+def percentiles(latencies: List[float]) -> str:
+    if len(latencies) < 2:
+        return 'not enough samples'
+    cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+    return f"p50={cuts[49] * 1000:.1f} ms p95={cuts[94] * 1000:.1f} ms p99={cuts[98] * 1000:.1f} ms"
+
+
+async def run(args: argparse.Namespace) -> None:
+    options = StandInOptions(own_cameras=args.own, shared_cameras=args.shared, latency=args.latency / 1000,
+                             jitter=args.jitter / 1000, padding=args.padding, error_rate=args.error_rate,
+                             throttle_rate=args.throttle_rate, seed=args.seed)
+    retry_policy = RetryPolicy(max_attempts=args.max_attempts, base_delay=timedelta(milliseconds=1))
+    latencies: List[float] = []
+    failures = 0
+
+    async with StandInServer(options) as server:
+        apis = [SpypointApi(f'user-{index}', 'password', retry_policy=retry_policy) for index in range(args.clients)]
+        for api in apis:
+            api.base_url = server.base_url
+
+        async def poll(api: SpypointApi) -> None:
+            nonlocal failures
+            for _ in range(args.iterations):
+                started = time.perf_counter()
+                try:
+                    await api.async_get_cameras()
+                except Exception:
+                    failures += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(poll(api) for api in apis))
+        finally:
+            await asyncio.gather(*(api.close() for api in apis))
+        elapsed = time.perf_counter() - started
+
+    calls = args.clients * args.iterations
+    print(f"clients={args.clients} iterations={args.iterations} own={args.own} shared={args.shared} "
+          f"latency={args.latency}±{args.jitter} ms padding={args.padding} "
+          f"error_rate={args.error_rate} throttle_rate={args.throttle_rate}")
+    print(f"async_get_cameras: {calls / elapsed:.1f} calls/s, "
+          f"{len(latencies) * (args.own + args.shared) / elapsed:.0f} cameras/s, {failures} failed")
+    print(f"latency: {percentiles(latencies)}")
+    print(f"requests: {dict(server.requests)}")
+    print(f"statuses: {dict(server.statuses)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark async_get_cameras against a local stand-in server.')
+    parser.add_argument('--clients', type=int, default=10)
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--own', type=int, default=20, help='own cameras per account')
+    parser.add_argument('--shared', type=int, default=50, help='shared cameras per account')
+    parser.add_argument('--latency', type=float, default=5, help='server latency in ms')
+    parser.add_argument('--jitter', type=float, default=5, help='latency jitter in ms')
+    parser.add_argument('--padding', type=int, default=0, help='extra bytes per camera payload')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--max-attempts', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
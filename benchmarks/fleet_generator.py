@@ -0,0 +1,116 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+MODELS = ('FLEX', 'FLEX-M', 'FLEX-G36', 'LINK-MICRO-LTE', 'LINK-EVO', 'FORCE-20', 'MICRO-LTE')
+FIRMWARES = ('1.2.3', '1.2.4', '2.0.1', '4.5.6', '4.6.0')
+BATTERY_TYPES = ('AA', 'LITHIUM', '12V', 'SOLAR')
+CAPTURE_MODES = ('photo', 'video', 'timeLapse')
+QUALITIES = ('low', 'medium', 'high')
+SENSIBILITIES = ('low', 'medium', 'high')
+NOTIFICATIONS = ('low_battery', 'sd_card_full', 'missing_sd_card', 'firmware_update')
+OWNERS = ('Francois ', 'Marie', ' Jean', 'Alex', None)
+EPOCH = datetime(2024, 10, 30, tzinfo=timezone.utc)
+
+
+class FleetGenerator:
+    # camera payloads shaped like /camera/all, each one depends only on the seed and its index
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+
+    def cameras(self, count: int, start: int = 0) -> List[Dict[str, Any]]:
+        return [self.camera(index) for index in range(start, start + count)]
+
+    def shared_cameras(self, camera_ids: List[str]) -> List[Dict[str, Any]]:
+        return [{'sharedCameras': [{'cameraId': camera_id} for camera_id in camera_ids]}]
+
+    def camera(self, index: int) -> Dict[str, Any]:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        camera: Dict[str, Any] = {
+            'id': f'camera-{self.seed}-{index}',
+            'config': self._config(rng, index),
+            'status': self._status(rng),
+        }
+        if rng.random() < 0.9:
+            camera['activationDate'] = self._date(rng, days=400)
+        if rng.random() < 0.9:
+            camera['creationDate'] = self._date(rng, days=800)
+        if rng.random() < 0.8:
+            camera['isCellular' if rng.random() < 0.5 else 'cellular'] = rng.random() < 0.9
+        owner = rng.choice(OWNERS)
+        if owner is not None:
+            camera['ownerFirstName'] = owner
+        subscriptions = self._subscriptions(rng)
+        if subscriptions is not None:
+            camera['subscriptions'] = subscriptions
+        return camera
+
+    def _config(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        config: Dict[str, Any] = {'name': f'camera {index}'}
+        optional = {
+            'captureMode': rng.choice(CAPTURE_MODES),
+            'delay': rng.choice((0, 10, 30, 60, 300)),
+            'multiShot': rng.randint(1, 3),
+            'quality': rng.choice(QUALITIES),
+            'operationMode': rng.choice(('standard', 'standby')),
+            'sensibility': {'level': rng.choice(SENSIBILITIES)},
+            'transmitAuto': rng.random() < 0.8,
+            'transmitFormat': rng.choice(('full', 'thumbnail')),
+            'transmitFreq': rng.choice((1, 2, 4, 6, 12, 24)),
+            'transmitTime': {'hour': rng.randint(0, 23), 'minute': rng.choice((0, 15, 30, 45))},
+            'triggerSpeed': rng.choice(('optimal', 'fast')),
+        }
+        config.update((key, value) for key, value in optional.items() if rng.random() < 0.95)
+        return config
+
+    def _status(self, rng: random.Random) -> Dict[str, Any]:
+        status: Dict[str, Any] = {
+            'model': rng.choice(MODELS),
+            'lastUpdate': self._date(rng, days=3),
+        }
+        if rng.random() < 0.95:
+            status['modemFirmware'] = rng.choice(FIRMWARES)
+        if rng.random() < 0.95:
+            status['version'] = rng.choice(FIRMWARES)
+        if rng.random() < 0.9:
+            status['signal'] = {'processed': {'percentage': rng.randint(0, 100), 'bar': rng.randint(0, 5)}}
+        if rng.random() < 0.9:
+            unit = rng.choice(('C', 'F'))
+            value = rng.randint(-30, 40) if unit == 'C' else rng.randint(-20, 104)
+            status['temperature'] = {'unit': unit, 'value': value}
+        if rng.random() < 0.9:
+            status['batteries'] = [rng.choice((0, rng.randint(1, 100))) for _ in range(rng.randint(1, 3))]
+            status['batteryType'] = rng.choice(BATTERY_TYPES)
+        if rng.random() < 0.9:
+            size = rng.choice((0, 16_000, 32_000, 64_000))
+            status['memory'] = {'used': rng.randint(0, size), 'size': size}
+        if rng.random() < 0.9:
+            status['notifications'] = rng.sample(NOTIFICATIONS, rng.randint(0, 2))
+        if rng.random() < 0.8:
+            position_type = 'Point' if rng.random() < 0.95 else 'Polygon'
+            coordinates = [round(rng.uniform(-80, -60), 6), round(rng.uniform(40, 55), 6)]
+            status['coordinates'] = [{'position': {'type': position_type, 'coordinates': coordinates}}]
+        return status
+
+    def _subscriptions(self, rng: random.Random) -> List[Dict[str, Any]] | None:
+        draw = rng.random()
+        if draw < 0.05:
+            return None
+        if draw < 0.1:
+            return []
+        subscriptions = []
+        for _ in range(1 if draw < 0.9 else 2):
+            limit = rng.choice((100, 250, 1000, None))
+            subscriptions.append({
+                'photoCount': rng.randint(0, limit or 5000),
+                'photoLimit': limit,
+                'hdPhotoCount': rng.randint(0, 100),
+                'hdPhotoLimit': rng.choice((0, 100)),
+            })
+        return subscriptions
+
+    @staticmethod
+    def _date(rng: random.Random, days: int) -> str:
+        date = EPOCH - timedelta(seconds=rng.randint(0, days * 24 * 3600), milliseconds=rng.randint(0, 999))
+        return date.strftime('%Y-%m-%dT%H:%M:%S.') + f'{date.microsecond // 1000:03d}Z'
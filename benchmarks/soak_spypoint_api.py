@@ -0,0 +1,148 @@
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import List
+
+import aiohttp
+
+from spypointapi import RetryPolicy, SpypointApi
+from .stand_in_server import StandInOptions, StandInServer
+
+
+@dataclass()
+class Sample:
+    elapsed: float
+    polls: int
+    failures: int
+    rss: int
+    traced: int
+
+
+class DiscardingHandler(logging.Handler):
+    # formats every record like a real handler would, then drops it
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+def rss_bytes() -> int:
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+        # peak instead of current on platforms without /proc, still catches steady growth
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+def take_sample(started: float, polls: int, failures: int) -> Sample:
+    gc.collect()
+    return Sample(time.monotonic() - started, polls, failures, rss_bytes(), tracemalloc.get_traced_memory()[0])
+
+
+def mib(size: float) -> str:
+    return f"{size / 1024 / 1024:+.2f} MiB"
+
+
+async def soak(args: argparse.Namespace) -> bool:
+    options = StandInOptions(own_cameras=args.own, shared_cameras=args.shared, latency=args.latency / 1000,
+                             jitter=args.latency / 1000, error_rate=args.error_rate,
+                             throttle_rate=args.throttle_rate, token_lifetime=args.token_lifetime)
+    retry_policy = RetryPolicy(max_attempts=3, base_delay=timedelta(milliseconds=1))
+    polls = 0
+    failures = 0
+    stopping = asyncio.Event()
+
+    async with StandInServer(options) as server, aiohttp.ClientSession() as session:
+        apis = [SpypointApi(f'user-{index}', 'password', session, retry_policy=retry_policy,
+                            refresh_before_expiry=timedelta(seconds=args.token_lifetime / 2))
+                for index in range(args.clients)]
+        for api in apis:
+            api.base_url = server.base_url
+
+        async def poll(api: SpypointApi) -> None:
+            nonlocal polls, failures
+            while not stopping.is_set():
+                try:
+                    await api.async_get_cameras()
+                except Exception:
+                    failures += 1
+                polls += 1
+                await asyncio.sleep(args.poll_interval)
+
+        tasks = [asyncio.create_task(poll(api)) for api in apis]
+        started = time.monotonic()
+        try:
+            # let pools, caches and interned strings settle before the baseline
+            await asyncio.sleep(args.warm_up)
+            # the snapshot itself takes memory, keep it out of the rss growth
+            baseline_snapshot = tracemalloc.take_snapshot()
+            baseline = take_sample(started, polls, failures)
+            samples: List[Sample] = [baseline]
+            while time.monotonic() - started < args.warm_up + args.duration:
+                await asyncio.sleep(args.sample_interval)
+                samples.append(take_sample(started, polls, failures))
+                sample = samples[-1]
+                print(f"{sample.elapsed:7.1f} s  polls={sample.polls} failures={sample.failures}  "
+                      f"rss {mib(sample.rss - baseline.rss)}  traced {mib(sample.traced - baseline.traced)}")
+        finally:
+            stopping.set()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        final_snapshot = tracemalloc.take_snapshot()
+
+    print(f"requests: {dict(server.requests)}")
+    print("top allocators since baseline:")
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    statistics = final_snapshot.filter_traces(filters).compare_to(baseline_snapshot.filter_traces(filters), 'lineno')
+    for statistic in sorted(statistics, key=lambda statistic: statistic.size_diff, reverse=True)[:args.top]:
+        print(f"  {statistic}")
+
+    rss_growth = samples[-1].rss - baseline.rss
+    traced_growth = samples[-1].traced - baseline.traced
+    limit = args.max_growth * 1024 * 1024
+    passed = rss_growth <= limit and traced_growth <= limit
+    print(f"{'PASS' if passed else 'FAIL'}: rss {mib(rss_growth)}, traced {mib(traced_growth)}, "
+          f"threshold {args.max_growth} MiB")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Poll a local stand-in server with many clients and watch memory.')
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--duration', type=float, default=60, help='seconds measured after the warm up')
+    parser.add_argument('--warm-up', type=float, default=10, help='seconds before the baseline sample')
+    parser.add_argument('--sample-interval', type=float, default=5)
+    parser.add_argument('--poll-interval', type=float, default=0.1)
+    parser.add_argument('--own', type=int, default=5)
+    parser.add_argument('--shared', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=2, help='server latency and jitter in ms')
+    parser.add_argument('--error-rate', type=float, default=0.01)
+    parser.add_argument('--throttle-rate', type=float, default=0.01)
+    parser.add_argument('--token-lifetime', type=int, default=20, help='seconds, short to cycle logins and headers')
+    parser.add_argument('--debug-logging', action='store_true', help='format debug logs of every request')
+    parser.add_argument('--max-growth', type=float, default=10, help='MiB of rss or traced growth that fails the run')
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.debug_logging:
+        logger = logging.getLogger('spypointapi')
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(DiscardingHandler())
+        logger.propagate = False
+
+    tracemalloc.start(5)
+    passed = asyncio.run(soak(args))
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict
+
+import jwt
+from aiohttp import web
+
+from .fleet_generator import FleetGenerator
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@dataclass()
+class StandInOptions:
+    own_cameras: int = 20
+    shared_cameras: int = 50
+    latency: float = 0.005
+    jitter: float = 0.005
+    padding: int = 0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    token_lifetime: int = 3600
+    seed: int = 0
+
+
+class StandInServer:
+    # a real aiohttp server on localhost, so connector, sockets and body streaming are part of the measure
+
+    def __init__(self, options: StandInOptions | None = None):
+        self.options = options or StandInOptions()
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self.base_url = ''
+        self._random = random.Random(self.options.seed)
+        self._fleet = FleetGenerator(self.options.seed)
+        self._runner: web.AppRunner | None = None
+
+        own = [self._camera(f'own-{index}', index) for index in range(self.options.own_cameras)]
+        shared_ids = [f'shared-{index}' for index in range(self.options.shared_cameras)]
+        self._own_body = json.dumps(own).encode()
+        self._shared_body = json.dumps(self._fleet.shared_cameras(shared_ids)).encode()
+        self._shared_camera_bodies = {
+            camera_id: json.dumps(self._camera(camera_id, self.options.own_cameras + index)).encode()
+            for index, camera_id in enumerate(shared_ids)
+        }
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post('/api/v3/user/login', self._route('/user/login', self._login))
+        app.router.add_get('/api/v3/camera/all', self._route('/camera/all', self._own_cameras))
+        app.router.add_get('/api/v3/shared-cameras/all', self._route('/shared-cameras/all', self._shared_cameras))
+        app.router.add_get('/api/v3/shared-cameras/{camera_id}',
+                           self._route('/shared-cameras/{id}', self._shared_camera))
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f'http://127.0.0.1:{port}/api/v3'
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'StandInServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    def _route(self, name: str, handle: Handler) -> Handler:
+        async def route(request: web.Request) -> web.StreamResponse:
+            self.requests[name] += 1
+            await asyncio.sleep(max(self.options.latency + self._random.uniform(-1, 1) * self.options.jitter, 0))
+
+            draw = self._random.random()
+            if draw < self.options.throttle_rate:
+                response = web.Response(status=429, headers={'Retry-After': '0'})
+            elif draw < self.options.throttle_rate + self.options.error_rate:
+                response = web.Response(status=500)
+            else:
+                response = await handle(request)
+            self.statuses[response.status] += 1
+            return response
+        return route
+
+    async def _login(self, request: web.Request) -> web.Response:
+        token = jwt.encode({'exp': int(time.time()) + self.options.token_lifetime}, 'secret')
+        return web.json_response({'token': token})
+
+    async def _own_cameras(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._own_body, content_type='application/json')
+
+    async def _shared_cameras(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._shared_body, content_type='application/json')
+
+    async def _shared_camera(self, request: web.Request) -> web.Response:
+        body = self._shared_camera_bodies.get(request.match_info['camera_id'])
+        if body is None:
+            return web.Response(status=404)
+        return web.Response(body=body, content_type='application/json')
+
+    def _camera(self, camera_id: str, index: int) -> Dict[str, Any]:
+        camera = self._fleet.camera(index)
+        camera['id'] = camera_id
+        if self.options.padding:
+            # stands in for the fields this client ignores, it still has to download and decode them
+            camera['padding'] = 'x' * self.options.padding
+        return camera
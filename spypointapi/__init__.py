@@ -1,11 +1,59 @@
 __all__ = [
+    "AccountResult",
+    "AdaptiveLimiter",
     "Camera",
+    "CameraAdded",
+    "CameraChanged",
+    "CameraEvent",
+    "CameraParseCache",
+    "CameraRemoved",
+    "CamerasResult",
+    "CameraSnapshot",
+    "CamerasSourceError",
+    "CircuitBreakers",
+    "CircuitState",
+    "ConditionalRequests",
+    "ConnectionOptions",
     "Coordinates",
+    "EndpointStats",
+    "FleetMask",
+    "FleetSnapshot",
+    "FileTokenStore",
+    "Instrumentation",
+    "LatencyHistogram",
+    "LazyCamera",
+    "LazyCameraApiResponse",
+    "MemoryTokenStore",
+    "RefreshSchedule",
+    "RequestEvent",
+    "RetryAttempt",
+    "RetryPolicy",
+    "SpypointApiCircuitOpenError",
     "SpypointApiError",
     "SpypointApiInvalidCredentialsError",
     "SpypointApi",
+    "SpypointApiPool",
+    "SqliteSnapshotStore",
+    "StoredToken",
+    "TtlCache",
 ]
 
+from .adaptive_limiter import AdaptiveLimiter
 from .cameras.camera import Camera, Coordinates
-from .spypoint_api_errors import SpypointApiError, SpypointApiInvalidCredentialsError
+from .cameras.camera_events import CameraAdded, CameraChanged, CameraEvent, CameraRemoved
+from .cameras.camera_parse_cache import CameraParseCache
+from .cameras.cameras_result import CamerasResult, CamerasSourceError
+from .cameras.lazy_camera import LazyCamera, LazyCameraApiResponse
+from .cameras.refresh_schedule import RefreshSchedule
+from .circuit_breaker import CircuitBreakers, CircuitState
+from .conditional_requests import ConditionalRequests
+from .instrumentation import EndpointStats, Instrumentation, LatencyHistogram, RequestEvent
+from .connection_options import ConnectionOptions
+from .retry_policy import RetryAttempt, RetryPolicy
+from .spypoint_api_errors import SpypointApiCircuitOpenError, SpypointApiError, SpypointApiInvalidCredentialsError
+from .fleet_snapshot import FleetMask, FleetSnapshot
+from .snapshot_store import CameraSnapshot, SqliteSnapshotStore
+from .token_store import FileTokenStore, MemoryTokenStore, StoredToken
+from .ttl_cache import TtlCache
 from .spypoint_api import SpypointApi
+from .spypoint_api_pool import AccountResult, SpypointApiPool
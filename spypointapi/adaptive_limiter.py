@@ -0,0 +1,115 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import AsyncIterator, Collection, Deque
+
+from aiohttp import ClientResponseError
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that halves when the server throttles and grows by one after a window of successes."""
+
+    def __init__(self, limit: int = 10, min_limit: int = 1, max_limit: int = 50,
+                 throttled_statuses: Collection[int] = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE)):
+        if not 1 <= min_limit <= limit <= max_limit:
+            raise ValueError(f'expected 1 <= min_limit <= limit <= max_limit, got {min_limit}, {limit}, {max_limit}')
+        self.limit = limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.throttled_statuses = frozenset(throttled_statuses)
+        self.in_flight = 0
+        self.throttled_count = 0
+        self._successes = 0
+        self._generation = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator['LimiterSlot']:
+        await self._acquire()
+        slot = LimiterSlot(self)
+        try:
+            yield slot
+        except ClientResponseError as error:
+            if error.status in self.throttled_statuses and not slot.throttled:
+                self._on_throttled(slot.generation)
+            raise
+        else:
+            self._on_success()
+        finally:
+            if slot.held:
+                self._release()
+
+    def _on_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_limit:
+            self.limit += 1
+            self._successes = 0
+            self._wake_up_waiters()
+
+    def _on_throttled(self, generation: int) -> None:
+        self.throttled_count += 1
+        # requests started before the last decrease were sent at the old limit, do not penalize twice
+        if generation != self._generation:
+            return
+        self._generation += 1
+        self._successes = 0
+        self.limit = max(self.min_limit, self.limit // 2)
+
+    async def _acquire(self) -> None:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._wake_up_waiters()
+
+    def _wake_up_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class LimiterSlot:
+    """Slot held by one call, through which retried attempts report throttling and give the slot up while waiting."""
+
+    def __init__(self, limiter: AdaptiveLimiter):
+        self.limiter = limiter
+        self.generation = limiter._generation
+        self.held = True
+        self.throttled = False
+
+    def record_status(self, status: int | None) -> None:
+        if status not in self.limiter.throttled_statuses:
+            return
+        self.throttled = True
+        self.limiter._on_throttled(self.generation)
+        self.generation = self.limiter._generation
+
+    @asynccontextmanager
+    async def released(self) -> AsyncIterator[None]:
+        # other calls may use the slot while this one backs off, it waits its turn again afterwards
+        self.held = False
+        self.limiter._release()
+        yield
+        await self.limiter._acquire()
+        self.held = True
+        self.generation = self.limiter._generation
@@ -7,19 +7,19 @@ Celsius: TypeAlias = int
 Degrees: TypeAlias = float
 
 
-@dataclass()
+@dataclass(slots=True, frozen=True)
 class Coordinates:
     latitude: Degrees
     longitude: Degrees
 
 
-@dataclass()
+@dataclass(slots=True, frozen=True)
 class TransmitTime:
     hour: int
     minute: int
 
 
-@dataclass()
+@dataclass(slots=True)
 class Camera:
     id: str
     name: str
@@ -1,56 +1,56 @@
-from datetime import datetime
-from typing import Dict, Any, List
+import sys
+from dataclasses import fields
+from datetime import datetime, tzinfo
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Protocol
 
-from .subscription_api_response import SubscriptionApiResponse
 from .. import Camera
 from .camera import Coordinates, TransmitTime
 
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def intern_string(value: Any) -> Any:
+    # models, firmwares and settings repeat across the fleet, share one string instead of one per camera
+    return sys.intern(value) if type(value) is str else value
+
+
+def local_datetime_from_json(date_str: str, current_timezone: tzinfo | None) -> datetime:
+    # same result as replace(tzinfo=...), combine skips replace's keyword parsing and is several times faster
+    parsed = datetime.fromisoformat(date_str)
+    return datetime.combine(parsed, parsed.time(), current_timezone)
+
+
+class CameraParseContext:
+
+    def __init__(self, current_timezone: tzinfo | None = None):
+        # dates are read as local times, resolve the local timezone once for the whole batch
+        self.current_timezone = current_timezone or datetime.now().astimezone().tzinfo
+
+
+class CameraParser(Protocol):
+
+    def from_json(self, data: List[Dict[str, Any]]) -> List[Camera]: ...
+
+    def camera_from_json(self, data: Dict[str, Any], context: CameraParseContext | None = None) -> Camera: ...
+
 
 class CameraApiResponse:
 
     @classmethod
     def from_json(cls, data: List[Dict[str, Any]]) -> List[Camera]:
-        return [CameraApiResponse.camera_from_json(d) for d in data]
+        context = CameraParseContext()
+        camera_from_json = CameraApiResponse.camera_from_json
+        return [camera_from_json(d, context) for d in data]
 
     @classmethod
-    def camera_from_json(cls, data: Dict[str, Any]) -> Camera:
-        config = data.get('config', {})
-        status = data.get('status', {})
-        subscription = SubscriptionApiResponse.subscription_from_json(data.get('subscriptions'))
-        return Camera(
-            id=data['id'],
-            name=config['name'],
-            model=status['model'],
-            modem_firmware=status.get('modemFirmware', ''),
-            camera_firmware=status.get('version', ''),
-            last_update_time=datetime.fromisoformat(status['lastUpdate'][:-1]).replace(tzinfo=datetime.now().astimezone().tzinfo),
-            signal=status.get('signal', {}).get('processed', {}).get('percentage', None),
-            temperature=CameraApiResponse.temperature_from_json(status.get('temperature', None)),
-            battery=CameraApiResponse.battery_from_json(status.get('batteries', None)),
-            battery_type=status.get('batteryType', None),
-            memory=CameraApiResponse.memory_from_json(status.get('memory', None)),
-            notifications=CameraApiResponse.notifications_from_json(status.get('notifications', None)),
-            owner=CameraApiResponse.owner_from_json(data),
-            coordinates=CameraApiResponse.coordinates_from_json(status.get('coordinates', None)),
-            activation_date=CameraApiResponse.datetime_from_json(data.get('activationDate')),
-            creation_date=CameraApiResponse.datetime_from_json(data.get('creationDate')),
-            is_cellular=data.get('isCellular', data.get('cellular', None)),
-            capture_mode=config.get('captureMode', None),
-            delay=config.get('delay', None),
-            multi_shot=config.get('multiShot', None),
-            quality=config.get('quality', None),
-            operation_mode=config.get('operationMode', None),
-            sensibility=config.get('sensibility', {}).get('level', None),
-            transmit_auto=config.get('transmitAuto', None),
-            transmit_format=config.get('transmitFormat', None),
-            transmit_freq=config.get('transmitFreq', None),
-            transmit_time=CameraApiResponse.transmit_time_from_json(config.get('transmitTime', None)),
-            trigger_speed=config.get('triggerSpeed', None),
-            photo_count=subscription.photoCount,
-            photo_limit=subscription.photoLimit,
-            hd_photo_count=subscription.hdPhotoCount,
-            hd_photo_limit=subscription.hdPhotoLimit,
-        )
+    def camera_from_json(cls, data: Dict[str, Any], context: CameraParseContext | None = None) -> Camera:
+        current_timezone = (context or CameraParseContext()).current_timezone
+        config = data.get('config', EMPTY)
+        status = data.get('status', EMPTY)
+        subscriptions = data.get('subscriptions')
+        subscription = subscriptions[0] if subscriptions else EMPTY
+        return Camera(*[read(data, config, status, subscription, current_timezone) for read in FIELD_READERS])
 
     @classmethod
     def temperature_from_json(cls, temperature: Dict[str, Any] | None) -> int | None:
@@ -105,8 +105,64 @@ class CameraApiResponse:
         return Coordinates(latitude=lat_lon[1], longitude=lat_lon[0])
 
     @classmethod
-    def datetime_from_json(cls, date_str: str | None) -> datetime | None:
+    def datetime_from_json(cls, date_str: str | None, current_timezone: tzinfo | None = None) -> datetime | None:
         if not date_str:
             return None
-        current_timezone = datetime.now().astimezone().tzinfo
-        return datetime.fromisoformat(date_str.rstrip('Z')).replace(tzinfo=current_timezone)
+        if current_timezone is None:
+            current_timezone = datetime.now().astimezone().tzinfo
+        return local_datetime_from_json(date_str.rstrip('Z'), current_timezone)
+
+
+# how each Camera field is read from a payload, shared by the eager and the lazy parser;
+# readers take the camera, its config, status and first subscription, and the local timezone
+CameraFieldReader = Callable[[Dict[str, Any], Mapping[str, Any], Mapping[str, Any], Mapping[str, Any], tzinfo], Any]
+
+CAMERA_FIELD_READERS: Dict[str, CameraFieldReader] = {
+    'id': lambda data, config, status, subscription, tz: data['id'],
+    'name': lambda data, config, status, subscription, tz: config['name'],
+    'model': lambda data, config, status, subscription, tz: intern_string(status['model']),
+    'modem_firmware': lambda data, config, status, subscription, tz: intern_string(status.get('modemFirmware', '')),
+    'camera_firmware': lambda data, config, status, subscription, tz: intern_string(status.get('version', '')),
+    'last_update_time': lambda data, config, status, subscription, tz:
+        local_datetime_from_json(status['lastUpdate'][:-1], tz),
+    'signal': lambda data, config, status, subscription, tz:
+        status.get('signal', EMPTY).get('processed', EMPTY).get('percentage', None),
+    'temperature': lambda data, config, status, subscription, tz:
+        CameraApiResponse.temperature_from_json(status.get('temperature', None)),
+    'battery': lambda data, config, status, subscription, tz:
+        CameraApiResponse.battery_from_json(status.get('batteries', None)),
+    'battery_type': lambda data, config, status, subscription, tz: intern_string(status.get('batteryType', None)),
+    'memory': lambda data, config, status, subscription, tz:
+        CameraApiResponse.memory_from_json(status.get('memory', None)),
+    'notifications': lambda data, config, status, subscription, tz:
+        CameraApiResponse.notifications_from_json(status.get('notifications', None)),
+    'owner': lambda data, config, status, subscription, tz: CameraApiResponse.owner_from_json(data),
+    'coordinates': lambda data, config, status, subscription, tz:
+        CameraApiResponse.coordinates_from_json(status.get('coordinates', None)),
+    'activation_date': lambda data, config, status, subscription, tz:
+        CameraApiResponse.datetime_from_json(data.get('activationDate'), tz),
+    'creation_date': lambda data, config, status, subscription, tz:
+        CameraApiResponse.datetime_from_json(data.get('creationDate'), tz),
+    'is_cellular': lambda data, config, status, subscription, tz: data.get('isCellular', data.get('cellular', None)),
+    'capture_mode': lambda data, config, status, subscription, tz: intern_string(config.get('captureMode', None)),
+    'delay': lambda data, config, status, subscription, tz: config.get('delay', None),
+    'multi_shot': lambda data, config, status, subscription, tz: config.get('multiShot', None),
+    'quality': lambda data, config, status, subscription, tz: intern_string(config.get('quality', None)),
+    'operation_mode': lambda data, config, status, subscription, tz: intern_string(config.get('operationMode', None)),
+    'sensibility': lambda data, config, status, subscription, tz:
+        intern_string(config.get('sensibility', EMPTY).get('level', None)),
+    'transmit_auto': lambda data, config, status, subscription, tz: config.get('transmitAuto', None),
+    'transmit_format': lambda data, config, status, subscription, tz:
+        intern_string(config.get('transmitFormat', None)),
+    'transmit_freq': lambda data, config, status, subscription, tz: config.get('transmitFreq', None),
+    'transmit_time': lambda data, config, status, subscription, tz:
+        CameraApiResponse.transmit_time_from_json(config.get('transmitTime', None)),
+    'trigger_speed': lambda data, config, status, subscription, tz: intern_string(config.get('triggerSpeed', None)),
+    'photo_count': lambda data, config, status, subscription, tz: subscription.get('photoCount'),
+    'photo_limit': lambda data, config, status, subscription, tz: subscription.get('photoLimit'),
+    'hd_photo_count': lambda data, config, status, subscription, tz: subscription.get('hdPhotoCount'),
+    'hd_photo_limit': lambda data, config, status, subscription, tz: subscription.get('hdPhotoLimit'),
+}
+
+# in Camera field order, so the eager parser can pass them positionally
+FIELD_READERS = tuple(CAMERA_FIELD_READERS[camera_field.name] for camera_field in fields(Camera))
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, fields
+from typing import Dict, FrozenSet, Iterable, List, TypeAlias
+
+from .camera import Camera
+
+
+@dataclass()
+class CameraAdded:
+    camera: Camera
+
+
+@dataclass()
+class CameraRemoved:
+    camera: Camera
+
+
+@dataclass()
+class CameraChanged:
+    camera: Camera
+    previous: Camera
+    changed_fields: FrozenSet[str]
+
+
+CameraEvent: TypeAlias = CameraAdded | CameraRemoved | CameraChanged
+
+
+def camera_events(previous: Dict[str, Camera], current: Iterable[Camera]) -> List[CameraEvent]:
+    events: List[CameraEvent] = []
+    current_ids = set()
+    for camera in current:
+        current_ids.add(camera.id)
+        previous_camera = previous.get(camera.id)
+        if previous_camera is None:
+            events.append(CameraAdded(camera))
+        elif previous_camera is not camera:
+            changes = changed_fields(previous_camera, camera)
+            if changes:
+                events.append(CameraChanged(camera, previous_camera, changes))
+
+    events.extend(CameraRemoved(camera) for camera_id, camera in previous.items() if camera_id not in current_ids)
+    return events
+
+
+def changed_fields(previous: Camera, current: Camera) -> FrozenSet[str]:
+    return frozenset(camera_field.name for camera_field in fields(Camera)
+                     if getattr(previous, camera_field.name) != getattr(current, camera_field.name))
@@ -0,0 +1,49 @@
+import marshal
+from typing import Any, Dict, List, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .. import Camera
+from .camera_api_response import CameraApiResponse, CameraParseContext, CameraParser
+
+
+class CameraParseCache:
+
+    def __init__(self, parser: CameraParser = CameraApiResponse):
+        self.parser = parser
+        self.reused = 0
+        self.rebuilt = 0
+        self._cameras: Dict[str, Tuple[int, Camera]] = {}
+        self._batch_ids: Set[str] = set()
+
+    def from_json(self, data: List[Dict[str, Any]]) -> List[Camera]:
+        context = CameraParseContext()
+        cameras = [self.camera_from_json(d, context) for d in data]
+
+        # cameras that left the fleet since the previous batch are not kept
+        batch_ids = {d['id'] for d in data}
+        for camera_id in self._batch_ids - batch_ids:
+            self._cameras.pop(camera_id, None)
+        self._batch_ids = batch_ids
+        return cameras
+
+    def camera_from_json(self, data: Dict[str, Any], context: CameraParseContext | None = None) -> Camera:
+        fingerprint = self.fingerprint(data)
+        cached = self._cameras.get(data['id'])
+        if cached is not None and cached[0] == fingerprint:
+            self.reused += 1
+            return cached[1]
+
+        camera = self.parser.camera_from_json(data, context)
+        self._cameras[data['id']] = (fingerprint, camera)
+        self.rebuilt += 1
+        return camera
+
+    @staticmethod
+    def fingerprint(data: Dict[str, Any]) -> int:
+        # serialized in C and hashed, an int is kept per camera rather than its payload;
+        # marshal version 2 writes no back references so equal payloads give equal bytes
+        return hash(orjson.dumps(data) if orjson is not None else marshal.dumps(data, 2))
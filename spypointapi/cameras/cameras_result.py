@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from .camera import Camera
+
+
+@dataclass()
+class CamerasSourceError:
+    source: str
+    error: Exception
+
+
+@dataclass()
+class CamerasResult:
+    cameras: List[Camera] = field(default_factory=list)
+    errors: List[CamerasSourceError] = field(default_factory=list)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.errors
@@ -0,0 +1,72 @@
+from dataclasses import fields
+from functools import cached_property
+from typing import Any, Dict, List
+
+from .camera import Camera
+from .camera_api_response import CAMERA_FIELD_READERS, EMPTY, CameraFieldReader, CameraParseContext
+
+CAMERA_FIELDS = tuple(camera_field.name for camera_field in fields(Camera))
+
+
+class LazyCamera:
+
+    def __init__(self, data: Dict[str, Any], context: CameraParseContext | None = None):
+        self._data = data
+        self._context = context or CameraParseContext()
+
+    is_online = Camera.is_online
+    __str__ = Camera.__str__
+
+    def to_camera(self) -> Camera:
+        return Camera(**{name: getattr(self, name) for name in CAMERA_FIELDS})
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (Camera, LazyCamera)):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in CAMERA_FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LazyCamera(id={self.id!r})"
+
+    @cached_property
+    def _config(self) -> Dict[str, Any]:
+        return self._data.get('config', EMPTY)
+
+    @cached_property
+    def _status(self) -> Dict[str, Any]:
+        return self._data.get('status', EMPTY)
+
+    @cached_property
+    def _subscription(self) -> Dict[str, Any]:
+        subscriptions = self._data.get('subscriptions')
+        return subscriptions[0] if subscriptions else EMPTY
+
+    def _read(self, read: CameraFieldReader) -> Any:
+        return read(self._data, self._config, self._status, self._subscription, self._context.current_timezone)
+
+
+def _lazy_field(name: str) -> cached_property:
+    read = CAMERA_FIELD_READERS[name]
+    lazy_field = cached_property(lambda camera: camera._read(read))
+    lazy_field.__set_name__(LazyCamera, name)
+    return lazy_field
+
+
+# each field is decoded with the eager parser's reader the first time it is read
+for _name in CAMERA_FIELDS:
+    setattr(LazyCamera, _name, _lazy_field(_name))
+del _name
+
+
+class LazyCameraApiResponse:
+
+    @classmethod
+    def from_json(cls, data: List[Dict[str, Any]]) -> List[LazyCamera]:
+        context = CameraParseContext()
+        return [LazyCamera(d, context) for d in data]
+
+    @classmethod
+    def camera_from_json(cls, data: Dict[str, Any], context: CameraParseContext | None = None) -> LazyCamera:
+        return LazyCamera(data, context)
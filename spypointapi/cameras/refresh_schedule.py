@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+
+from .camera import Camera
+
+
+class RefreshSchedule:
+
+    def __init__(self,
+                 min_interval: timedelta = timedelta(minutes=1),
+                 max_interval: timedelta = timedelta(hours=1),
+                 grace: timedelta = timedelta(minutes=5)):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.grace = grace
+
+    def next_refresh(self, camera: Camera, now: datetime) -> datetime:
+        return now + self.interval(camera, now)
+
+    def interval(self, camera: Camera, now: datetime) -> timedelta:
+        if not camera.is_online:
+            return self.max_interval
+
+        expected_update = self.expected_update(camera)
+        if expected_update is None:
+            return self.min_interval
+
+        return min(max(expected_update + self.grace - now, self.min_interval), self.max_interval)
+
+    @staticmethod
+    def expected_update(camera: Camera) -> datetime | None:
+        # transmit_freq is the number of hours between transmissions, 0 means the camera sends photos as they are taken
+        if not camera.transmit_freq:
+            return None
+
+        period = timedelta(hours=camera.transmit_freq)
+        if camera.transmit_time is None:
+            return camera.last_update_time + period
+
+        # transmissions are aligned on transmit_time, find the next slot after the last update
+        last_update = camera.last_update_time
+        anchor = last_update.replace(hour=camera.transmit_time.hour, minute=camera.transmit_time.minute,
+                                     second=0, microsecond=0)
+        return last_update + period - (last_update - anchor) % period
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass()
+@dataclass(slots=True, frozen=True)
 class SubscriptionApiResponse:
     photoCount: int | None
     photoLimit: int | None
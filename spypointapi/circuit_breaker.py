@@ -0,0 +1,106 @@
+import time
+from datetime import timedelta
+from enum import StrEnum
+from typing import Callable, Dict
+
+from .spypoint_api_errors import SpypointApiCircuitOpenError
+
+
+class CircuitState(StrEnum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+
+    def __init__(self, name: str,
+                 failure_threshold: int = 5,
+                 reset_timeout: timedelta = timedelta(seconds=30),
+                 half_open_probes: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.clock = clock
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at: float | None = None
+        self._probes_in_flight = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self.clock() - self._opened_at < self.reset_timeout.total_seconds():
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def before_request(self) -> bool:
+        # True when the request is one of the half-open probes
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return False
+        if state == CircuitState.HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+            self._probes_in_flight += 1
+            return True
+
+        self.rejected += 1
+        retry_in = self.reset_timeout - timedelta(seconds=self.clock() - self._opened_at)
+        raise SpypointApiCircuitOpenError(self.name, max(retry_in, timedelta(0)))
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probes_in_flight = 0
+
+    def record_abandoned(self, probing: bool) -> None:
+        # the caller gave up or failed on its side, say nothing about the server and free the probe
+        if probing:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            # a failed probe opens the circuit for another reset timeout
+            self._opened_at = self.clock()
+            self._probes_in_flight = 0
+
+
+class CircuitBreakers:
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 reset_timeout: timedelta = timedelta(seconds=30),
+                 half_open_probes: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        family = self.endpoint_family(url)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            breaker = CircuitBreaker(family, self.failure_threshold, self.reset_timeout, self.half_open_probes,
+                                     self.clock)
+            self._breakers[family] = breaker
+        return breaker
+
+    def state(self, family: str) -> CircuitState:
+        breaker = self._breakers.get(family)
+        return breaker.state if breaker else CircuitState.CLOSED
+
+    def states(self) -> Dict[str, CircuitState]:
+        return {family: breaker.state for family, breaker in self._breakers.items()}
+
+    @staticmethod
+    def endpoint_family(url: str) -> str:
+        if url == '/user/login':
+            return 'login'
+        if url.startswith('/shared-cameras'):
+            return 'shared-cameras'
+        return url.lstrip('/')
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping
+
+
+@dataclass()
+class ConditionalResult:
+    etag: str | None
+    last_modified: str | None
+    size: int
+    result: Any
+
+
+class ConditionalRequests:
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.not_modified_count = 0
+        self.bytes_saved = 0
+        self.parses_saved = 0
+        self._results: OrderedDict[str, ConditionalResult] = OrderedDict()
+
+    def lookup(self, url: str) -> ConditionalResult | None:
+        return self._results.get(url)
+
+    def headers_for(self, url: str, stored: ConditionalResult | None = None) -> Dict[str, str]:
+        stored = stored or self._results.get(url)
+        if stored is None:
+            return {}
+
+        headers = {}
+        if stored.etag is not None:
+            headers['If-None-Match'] = stored.etag
+        if stored.last_modified is not None:
+            headers['If-Modified-Since'] = stored.last_modified
+        return headers
+
+    def store(self, url: str, response_headers: Mapping[str, str], size: int, result: Any) -> None:
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            self._results.pop(url, None)
+            return
+
+        self._results[url] = ConditionalResult(etag, last_modified, size, result)
+        self._results.move_to_end(url)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def not_modified(self, url: str, stored: ConditionalResult) -> Any:
+        # the entry read when the request was sent, concurrent requests may have evicted it since
+        self._results[url] = stored
+        self._results.move_to_end(url)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        self.not_modified_count += 1
+        self.bytes_saved += stored.size
+        self.parses_saved += 1
+        return stored.result
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+
+@dataclass(frozen=True)
+class ConnectionOptions:
+    limit: int = 100
+    limit_per_host: int | None = None
+    keepalive_timeout: timedelta = timedelta(seconds=60)
+    dns_cache_ttl: timedelta = timedelta(minutes=5)
+    timeout: timedelta = timedelta(seconds=30)
+
+    def create_session(self, fan_out: int) -> ClientSession:
+        # every request goes to the same host, its limit follows the shared cameras fan-out
+        limit_per_host = self.limit_per_host or fan_out + 1
+        connector = TCPConnector(limit=max(self.limit, limit_per_host),
+                                 limit_per_host=limit_per_host,
+                                 keepalive_timeout=self.keepalive_timeout.total_seconds(),
+                                 ttl_dns_cache=int(self.dns_cache_ttl.total_seconds()),
+                                 enable_cleanup_closed=True)
+        return ClientSession(connector=connector, timeout=ClientTimeout(total=self.timeout.total_seconds()))
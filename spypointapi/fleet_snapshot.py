@@ -0,0 +1,178 @@
+import math
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .cameras.camera import Camera
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NUMERIC_FIELDS = ('signal', 'temperature', 'battery', 'memory', 'delay', 'multi_shot', 'transmit_freq',
+                  'photo_count', 'photo_limit', 'hd_photo_count', 'hd_photo_limit')
+CATEGORICAL_FIELDS = ('model', 'battery_type', 'owner', 'capture_mode', 'quality', 'operation_mode', 'sensibility',
+                      'transmit_format', 'trigger_speed')
+MISSING = -1
+
+
+class FleetMask:
+
+    def __init__(self, bits: Any, size: int):
+        # numpy bool array, or an int holding one byte per camera so that &, | and ~ run in C without numpy
+        self.bits = bits
+        self.size = size
+
+    def __and__(self, other: 'FleetMask') -> 'FleetMask':
+        return FleetMask(self.bits & other.bits, self.size)
+
+    def __or__(self, other: 'FleetMask') -> 'FleetMask':
+        return FleetMask(self.bits | other.bits, self.size)
+
+    def __invert__(self) -> 'FleetMask':
+        if isinstance(self.bits, int):
+            return FleetMask(self.bits ^ int.from_bytes(b'\x01' * self.size, 'little'), self.size)
+        return FleetMask(~self.bits, self.size)
+
+    def count(self) -> int:
+        if isinstance(self.bits, int):
+            return self.bits.bit_count()
+        return int(numpy.count_nonzero(self.bits))
+
+    def indices(self) -> List[int]:
+        if isinstance(self.bits, int):
+            return [index for index, selected in enumerate(self.bits.to_bytes(self.size, 'little')) if selected]
+        return numpy.flatnonzero(self.bits).tolist()
+
+
+class FleetSnapshot:
+
+    def __init__(self, ids: List[str], numeric: Dict[str, Any], categorical: Dict[str, Tuple[Any, List[str]]],
+                 use_numpy: bool):
+        self.ids = ids
+        self.use_numpy = use_numpy
+        self._numeric = numeric
+        self._categorical = categorical
+
+    @classmethod
+    def from_cameras(cls, cameras: Iterable[Camera], use_numpy: bool | None = None) -> 'FleetSnapshot':
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        if use_numpy and numpy is None:
+            raise ImportError('numpy is not installed')
+
+        ids = []
+        numeric = {name: array('d') for name in NUMERIC_FIELDS + ('last_update', 'photo_usage')}
+        codes = {name: array('i') for name in CATEGORICAL_FIELDS}
+        categories: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORICAL_FIELDS}
+        nan = math.nan
+
+        for camera in cameras:
+            ids.append(camera.id)
+            for name in NUMERIC_FIELDS:
+                value = getattr(camera, name)
+                numeric[name].append(nan if value is None else value)
+            for name in CATEGORICAL_FIELDS:
+                value = getattr(camera, name)
+                known = categories[name]
+                codes[name].append(MISSING if value is None else known.setdefault(value, len(known)))
+            numeric['last_update'].append(camera.last_update_time.timestamp())
+            numeric['photo_usage'].append(camera.photo_count / camera.photo_limit
+                                          if camera.photo_count is not None and camera.photo_limit else nan)
+
+        if use_numpy:
+            numeric = {name: numpy.frombuffer(column, dtype=numpy.float64) for name, column in numeric.items()}
+            codes = {name: numpy.frombuffer(column, dtype=numpy.intc) for name, column in codes.items()}
+
+        categorical = {name: (codes[name], list(categories[name])) for name in CATEGORICAL_FIELDS}
+        return cls(ids, numeric, categorical, use_numpy)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def column(self, name: str) -> Any:
+        if name in self._categorical:
+            return self._categorical[name][0]
+        return self._numeric[name]
+
+    def categories(self, name: str) -> List[str]:
+        return self._categorical[name][1]
+
+    def all(self) -> FleetMask:
+        return ~self.none()
+
+    def none(self) -> FleetMask:
+        return FleetMask(numpy.zeros(len(self), dtype=bool) if self.use_numpy else 0, len(self))
+
+    def less_than(self, name: str, value: float) -> FleetMask:
+        return self._compare(self._numeric[name], lambda column: column < value)
+
+    def greater_than(self, name: str, value: float) -> FleetMask:
+        return self._compare(self._numeric[name], lambda column: column > value)
+
+    def equals(self, name: str, value: Any) -> FleetMask:
+        if name not in self._categorical:
+            return self._compare(self._numeric[name], lambda column: column == value)
+
+        codes, categories = self._categorical[name]
+        code = categories.index(value) if value in categories else None
+        if code is None:
+            return self.none()
+        return self._compare(codes, lambda column: column == code)
+
+    def is_missing(self, name: str) -> FleetMask:
+        if name in self._categorical:
+            return self._compare(self._categorical[name][0], lambda column: column == MISSING)
+        return self._compare(self._numeric[name], lambda column: column != column)
+
+    def offline_for(self, duration: timedelta, now: datetime | None = None) -> FleetMask:
+        now = now or datetime.now().astimezone()
+        return self.less_than('last_update', (now - duration).timestamp())
+
+    def count(self, mask: FleetMask | None = None) -> int:
+        return len(self) if mask is None else mask.count()
+
+    def select_ids(self, mask: FleetMask) -> List[str]:
+        return [self.ids[index] for index in mask.indices()]
+
+    def min(self, name: str, mask: FleetMask | None = None) -> float | None:
+        values = self._values(name, mask)
+        return None if len(values) == 0 else float(min(values) if isinstance(values, list) else values.min())
+
+    def max(self, name: str, mask: FleetMask | None = None) -> float | None:
+        values = self._values(name, mask)
+        return None if len(values) == 0 else float(max(values) if isinstance(values, list) else values.max())
+
+    def mean(self, name: str, mask: FleetMask | None = None) -> float | None:
+        values = self._values(name, mask)
+        return None if len(values) == 0 else float(sum(values) / len(values) if isinstance(values, list)
+                                                   else values.mean())
+
+    def percentile(self, name: str, percent: float, mask: FleetMask | None = None) -> float | None:
+        values = self._values(name, mask)
+        if len(values) == 0:
+            return None
+        if not isinstance(values, list):
+            return float(numpy.percentile(values, percent))
+
+        # linear interpolation between closest ranks, same as numpy's default method
+        values = sorted(values)
+        rank = (len(values) - 1) * percent / 100
+        lower = math.floor(rank)
+        upper = math.ceil(rank)
+        return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+    def _compare(self, column: Any, compare: Callable[[Any], Any]) -> FleetMask:
+        if self.use_numpy:
+            return FleetMask(compare(column), len(self))
+        return FleetMask(int.from_bytes(bytes(compare(value) for value in column), 'little'), len(self))
+
+    def _values(self, name: str, mask: FleetMask | None) -> Sequence[float]:
+        column = self._numeric[name]
+        if self.use_numpy:
+            values = column if mask is None else column[mask.bits]
+            return values[~numpy.isnan(values)]
+
+        indices = range(len(column)) if mask is None else mask.indices()
+        return [column[index] for index in indices if column[index] == column[index]]
@@ -0,0 +1,139 @@
+import bisect
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from logging import Logger, getLogger
+from typing import Callable, Dict, Iterator, Sequence
+
+LOGGER: Logger = getLogger(__package__)
+
+LATENCY_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+@dataclass()
+class RequestEvent:
+    method: str
+    url: str
+    endpoint: str
+    started_at: float
+    status: int | None = None
+    error: BaseException | None = None
+    bytes: int = 0
+    attempts: int = 0
+    queue_time: timedelta = timedelta(0)
+    auth_time: timedelta = timedelta(0)
+    latency: timedelta | None = None
+
+
+class LatencyHistogram:
+
+    def __init__(self, bounds_ms: Sequence[float] = LATENCY_BOUNDS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        # one more bucket for latencies above the last bound
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total = timedelta(0)
+        self.max = timedelta(0)
+
+    def observe(self, latency: timedelta) -> None:
+        self.counts[bisect.bisect_left(self.bounds_ms, latency.total_seconds() * 1000)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def percentile(self, percent: float) -> timedelta | None:
+        # upper bound of the bucket holding the percentile, exact enough to spot regressions
+        if self.count == 0:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.bounds_ms, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(timedelta(milliseconds=bound), self.max)
+        return self.max
+
+
+@dataclass()
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    bytes: int = 0
+    statuses: Counter[int] = field(default_factory=Counter)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    queue_time: timedelta = timedelta(0)
+    auth_time: timedelta = timedelta(0)
+
+
+class Instrumentation:
+
+    def __init__(self,
+                 on_request_start: Callable[[RequestEvent], None] | None = None,
+                 on_request_end: Callable[[RequestEvent], None] | None = None,
+                 log_bodies: bool = False,
+                 max_logged_body: int = 2048,
+                 clock: Callable[[], float] = time.monotonic):
+        self.on_request_start = on_request_start
+        self.on_request_end = on_request_end
+        self.log_bodies = log_bodies
+        self.max_logged_body = max_logged_body
+        self.clock = clock
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    @contextmanager
+    def request(self, method: str, url: str) -> Iterator[RequestEvent]:
+        event = RequestEvent(method, url, self.endpoint(url), self.clock())
+        self._call(self.on_request_start, event)
+        try:
+            yield event
+        except GeneratorExit:
+            # a streaming consumer stopped early, the request itself did not fail
+            raise
+        except BaseException as error:
+            event.error = error
+            raise
+        finally:
+            event.latency = timedelta(seconds=self.clock() - event.started_at)
+            self._record(event)
+            self._call(self.on_request_end, event)
+
+    def stats(self, endpoint: str) -> EndpointStats:
+        return self.endpoints.setdefault(endpoint, EndpointStats())
+
+    def log_body(self, body: bytes | str | None) -> str:
+        if body is None:
+            return 'None'
+        text = body if isinstance(body, str) else body[:self.max_logged_body].decode('utf-8', errors='replace')
+        if len(body) > self.max_logged_body:
+            return f'{text[:self.max_logged_body]}... ({len(body)} bytes)'
+        return text
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        if url.startswith('/shared-cameras/') and url != '/shared-cameras/all':
+            return '/shared-cameras/{id}'
+        return url
+
+    def _record(self, event: RequestEvent) -> None:
+        stats = self.stats(event.endpoint)
+        stats.requests += 1
+        stats.bytes += event.bytes
+        stats.queue_time += event.queue_time
+        stats.auth_time += event.auth_time
+        stats.latency.observe(event.latency)
+        if event.status is not None:
+            stats.statuses[event.status] += 1
+        if event.error is not None:
+            stats.errors += 1
+
+    @staticmethod
+    def _call(hook: Callable[[RequestEvent], None] | None, event: RequestEvent) -> None:
+        if hook is None:
+            return
+        try:
+            hook(event)
+        except Exception as error:
+            # a broken hook must not fail the request it observes
+            LOGGER.debug(f"{event.url} : instrumentation hook failed: {error!r}")
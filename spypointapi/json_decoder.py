@@ -0,0 +1,18 @@
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonDecoder = Callable[[bytes], Any]
+
+
+def stdlib_json_decoder(body: bytes) -> Any:
+    # json.loads detects the utf encoding of bytes itself, no intermediate str is kept around
+    return json.loads(body)
+
+
+def default_json_decoder() -> JsonDecoder:
+    return orjson.loads if orjson is not None else stdlib_json_decoder
@@ -0,0 +1,75 @@
+import codecs
+import json
+from typing import Any, List
+
+
+class JsonArrayStream:
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._started = False
+        self._first_element = True
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self._buffer += self._utf8.decode(chunk)
+        return self._read_elements(final=False)
+
+    def close(self) -> List[Any]:
+        self._buffer += self._utf8.decode(b'', final=True)
+        elements = self._read_elements(final=True)
+        if not self._finished:
+            raise json.JSONDecodeError('Unterminated array', self._buffer, len(self._buffer))
+        return elements
+
+    def _read_elements(self, final: bool) -> List[Any]:
+        buffer = self._buffer
+        position = self._skip_whitespace(buffer, 0)
+        elements = []
+
+        if not self._started:
+            if position == len(buffer):
+                return elements
+            if buffer[position] != '[':
+                raise json.JSONDecodeError('Expecting array', buffer, position)
+            self._started = True
+            position = self._skip_whitespace(buffer, position + 1)
+
+        while not self._finished and position < len(buffer):
+            if self._first_element and buffer[position] == ']':
+                # an empty array, its closing bracket may come in any later chunk
+                self._finished = True
+                position += 1
+                break
+            try:
+                element, end = self._decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # element not complete yet, wait for the next chunk
+                if final:
+                    raise
+                break
+
+            separator = self._skip_whitespace(buffer, end)
+            if separator == len(buffer):
+                # a number may continue in the next chunk, only accept it once its separator arrived
+                break
+            if buffer[separator] not in ',]':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, separator)
+
+            elements.append(element)
+            self._first_element = False
+            self._finished = buffer[separator] == ']'
+            position = self._skip_whitespace(buffer, separator + 1)
+
+        if self._finished and buffer[position:].strip():
+            raise json.JSONDecodeError('Extra data', buffer, position)
+        self._buffer = buffer[position:]
+        return elements
+
+    @staticmethod
+    def _skip_whitespace(buffer: str, position: int) -> int:
+        while position < len(buffer) and buffer[position] in ' \t\n\r':
+            position += 1
+        return position
@@ -0,0 +1,83 @@
+import asyncio
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from logging import Logger, getLogger
+from typing import Callable, Collection
+
+from aiohttp import ClientConnectionError
+
+LOGGER: Logger = getLogger(__package__)
+
+RETRYABLE_ERRORS = (ClientConnectionError, asyncio.TimeoutError)
+
+
+@dataclass()
+class RetryAttempt:
+    url: str
+    attempt: int
+    status: int | None
+    elapsed: timedelta
+    retry_in: timedelta | None = None
+    error: Exception | None = None
+
+
+class RetryPolicy:
+
+    def __init__(self,
+                 max_attempts: int = 1,
+                 base_delay: timedelta = timedelta(milliseconds=500),
+                 max_delay: timedelta = timedelta(seconds=30),
+                 retry_statuses: Collection[int] = (HTTPStatus.TOO_MANY_REQUESTS,
+                                                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                                                    HTTPStatus.BAD_GATEWAY,
+                                                    HTTPStatus.SERVICE_UNAVAILABLE,
+                                                    HTTPStatus.GATEWAY_TIMEOUT),
+                 relogin_on_unauthorized: bool = True,
+                 on_attempt: Callable[[RetryAttempt], None] | None = None,
+                 jitter: Callable[[], float] = random.random):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.relogin_on_unauthorized = relogin_on_unauthorized
+        self.on_attempt = on_attempt
+        self.jitter = jitter
+
+    def should_retry(self, attempt: int, status: int | None = None, error: Exception | None = None) -> bool:
+        if attempt >= self.max_attempts:
+            return False
+        if error is not None:
+            return isinstance(error, RETRYABLE_ERRORS)
+        return status in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> timedelta:
+        requested = self.parse_retry_after(retry_after)
+        if requested is not None:
+            return min(requested, self.max_delay)
+
+        # full jitter spreads the retries of clients that failed at the same time
+        backoff = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+        return backoff * self.jitter()
+
+    def report(self, attempt: RetryAttempt) -> None:
+        LOGGER.debug(f"{attempt.url} : attempt {attempt.attempt} status=[{attempt.status}] error=[{attempt.error!r}] "
+                     f"elapsed=[{attempt.elapsed}] retry_in=[{attempt.retry_in}]")
+        if self.on_attempt is not None:
+            self.on_attempt(attempt)
+
+    @staticmethod
+    def parse_retry_after(retry_after: str | None) -> timedelta | None:
+        if not retry_after:
+            return None
+        if retry_after.strip().isdigit():
+            return timedelta(seconds=int(retry_after))
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(retry_at - datetime.now(timezone.utc), timedelta(0))
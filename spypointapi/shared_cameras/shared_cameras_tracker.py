@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Dict, List
+
+from ..cameras.camera import Camera
+from ..cameras.refresh_schedule import RefreshSchedule
+
+
+class SharedCamerasTracker:
+
+    def __init__(self, schedule: RefreshSchedule):
+        self.schedule = schedule
+        self._cameras: Dict[str, Camera] = {}
+        self._next_refresh: Dict[str, datetime] = {}
+
+    def camera_ids_to_refresh(self, camera_ids: List[str], now: datetime) -> List[str]:
+        for removed_id in self._cameras.keys() - set(camera_ids):
+            del self._cameras[removed_id]
+            del self._next_refresh[removed_id]
+
+        return [camera_id for camera_id in camera_ids
+                if camera_id not in self._cameras or self._next_refresh[camera_id] <= now]
+
+    def update(self, camera: Camera, now: datetime) -> None:
+        self._cameras[camera.id] = camera
+        self._next_refresh[camera.id] = self.schedule.next_refresh(camera, now)
+
+    def cameras(self, camera_ids: List[str]) -> List[Camera]:
+        return [self._cameras[camera_id] for camera_id in camera_ids if camera_id in self._cameras]
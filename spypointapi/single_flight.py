@@ -0,0 +1,54 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Shares one in-flight call per key between concurrent callers."""
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+    def start(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._done(key, done))
+        return task
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        # shield so a cancelled caller does not cancel the call shared with the others
+        return await asyncio.shield(self.start(key, factory))
+
+    async def join(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        # like run, but the call is cancelled once every caller waiting for it has given up
+        task = self._tasks.get(key)
+        if task is not None and task not in self._waiters:
+            # started in the background, it outlives its callers
+            return await asyncio.shield(task)
+
+        task = self.start(key, factory)
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if self._waiters[task] == 0:
+                del self._waiters[task]
+                if not task.done():
+                    task.cancel()
+
+    async def wait(self) -> None:
+        # lets every call in flight finish, their errors stay with their callers
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # callers awaiting the task get the error, background starts must not warn about it
+            task.exception()
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import sqlite3
+from contextlib import closing
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from logging import Logger, getLogger
+from os import PathLike
+from typing import Any, Dict, List, Protocol
+
+from .cameras.camera import Camera, Coordinates, TransmitTime
+
+LOGGER: Logger = getLogger(__package__)
+
+DATETIME_FIELDS = ('last_update_time', 'activation_date', 'creation_date')
+
+
+@dataclass()
+class CameraSnapshot:
+    cameras: List[Camera]
+    stored_at: datetime
+
+
+class SnapshotStore(Protocol):
+
+    async def load(self, account: str, source: str) -> CameraSnapshot | None: ...
+
+    async def save(self, account: str, source: str, cameras: List[Camera]) -> None: ...
+
+
+class SqliteSnapshotStore:
+
+    def __init__(self, path: str | PathLike[str]):
+        self.path = path
+        self._created = False
+
+    async def load(self, account: str, source: str) -> CameraSnapshot | None:
+        return await asyncio.to_thread(self._load, account, source)
+
+    async def save(self, account: str, source: str, cameras: List[Camera]) -> None:
+        await asyncio.to_thread(self._save, account, source, cameras)
+
+    def _load(self, account: str, source: str) -> CameraSnapshot | None:
+        with closing(self._connect()) as connection:
+            row = connection.execute('SELECT stored_at, cameras FROM snapshots WHERE account = ? AND source = ?',
+                                     (account, source)).fetchone()
+        if row is None:
+            return None
+
+        stored_at, cameras = row
+        try:
+            return CameraSnapshot([camera_from_dict(data) for data in json.loads(cameras)],
+                                  datetime.fromtimestamp(stored_at, timezone.utc))
+        except (ValueError, TypeError, KeyError) as error:
+            # a snapshot written by an incompatible version is only a cold start
+            LOGGER.debug(f"{source} : ignoring unreadable snapshot for {account}: {error!r}")
+            return None
+
+    def _save(self, account: str, source: str, cameras: List[Camera]) -> None:
+        data = json.dumps([camera_to_dict(camera) for camera in cameras])
+        with closing(self._connect()) as connection, connection:
+            connection.execute('INSERT OR REPLACE INTO snapshots (account, source, stored_at, cameras) '
+                               'VALUES (?, ?, ?, ?)',
+                               (account, source, datetime.now(timezone.utc).timestamp(), data))
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        if not self._created:
+            # several workers may share the file, let readers proceed while one of them writes
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS snapshots ('
+                               'account TEXT NOT NULL, source TEXT NOT NULL, stored_at REAL NOT NULL, '
+                               'cameras TEXT NOT NULL, PRIMARY KEY (account, source))')
+            self._created = True
+        return connection
+
+
+def camera_to_dict(camera: Camera) -> Dict[str, Any]:
+    # field by field rather than asdict, so cameras from any parser (LazyCamera included) can be stored
+    data = {field.name: getattr(camera, field.name) for field in fields(Camera)}
+    for name in DATETIME_FIELDS:
+        if data[name] is not None:
+            data[name] = data[name].isoformat()
+    for name in ('coordinates', 'transmit_time'):
+        if data[name] is not None:
+            data[name] = asdict(data[name])
+    return data
+
+
+def camera_from_dict(data: Dict[str, Any]) -> Camera:
+    values = {field.name: data[field.name] for field in fields(Camera) if field.name in data}
+    for name in DATETIME_FIELDS:
+        if values.get(name) is not None:
+            values[name] = datetime.fromisoformat(values[name])
+    if values.get('coordinates') is not None:
+        values['coordinates'] = Coordinates(**values['coordinates'])
+    if values.get('transmit_time') is not None:
+        values['transmit_time'] = TransmitTime(**values['transmit_time'])
+    return Camera(**values)
@@ -1,41 +1,168 @@
 import asyncio
+import itertools
+import time
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from logging import Logger, getLogger
-from typing import List
+from logging import DEBUG, Logger, getLogger
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Sequence, Tuple, TypeVar
 import jwt
-from aiohttp import ClientSession, ClientResponse
+from aiohttp import ClientError, ClientSession, ClientResponse
 
-from . import Camera, SpypointApiError, SpypointApiInvalidCredentialsError
-from .cameras.camera_api_response import CameraApiResponse
+from . import (AdaptiveLimiter, Camera, CamerasResult, CamerasSourceError, SpypointApiError,
+               SpypointApiInvalidCredentialsError)
+from .adaptive_limiter import LimiterSlot
+from .cameras.camera_api_response import CameraApiResponse, CameraParseContext, CameraParser
+from .cameras.camera_events import CameraEvent, camera_events
+from .cameras.refresh_schedule import RefreshSchedule
+from .circuit_breaker import CircuitBreakers
+from .conditional_requests import ConditionalRequests
+from .instrumentation import Instrumentation, RequestEvent
+from .connection_options import ConnectionOptions
+from .json_decoder import JsonDecoder, default_json_decoder
+from .json_stream import JsonArrayStream
+from .retry_policy import RETRYABLE_ERRORS, RetryAttempt, RetryPolicy
 from .shared_cameras.shared_cameras_api_response import SharedCamerasApiResponse
+from .shared_cameras.shared_cameras_tracker import SharedCamerasTracker
+from .single_flight import SingleFlight
+from .snapshot_store import SnapshotStore
+from .token_store import StoredToken, TokenStore
+from .ttl_cache import TtlCache
 
 LOGGER: Logger = getLogger(__package__)
 
+T = TypeVar('T')
+
 
 class SpypointApi:
     base_url = 'https://restapi.spypoint.com/api/v3'
 
-    def __init__(self, username: str, password: str, session: ClientSession):
+    def __init__(self, username: str, password: str, session: ClientSession | None = None,
+                 refresh_before_expiry: timedelta = timedelta(0),
+                 shared_cameras_limiter: AdaptiveLimiter | None = None,
+                 cache: TtlCache | None = None,
+                 shared_cameras_schedule: RefreshSchedule | None = None,
+                 conditional_requests: ConditionalRequests | None = None,
+                 retry_policy: RetryPolicy | None = None,
+                 circuit_breakers: CircuitBreakers | None = None,
+                 request_semaphores: Sequence[asyncio.Semaphore] = (),
+                 camera_parser: CameraParser = CameraApiResponse,
+                 json_decoder: JsonDecoder | None = None,
+                 snapshot_store: SnapshotStore | None = None,
+                 snapshot_interval: timedelta = timedelta(minutes=5),
+                 token_store: TokenStore | None = None,
+                 connection_options: ConnectionOptions | None = None,
+                 instrumentation: Instrumentation | None = None):
         self.username = username
         self.password = password
-        self.session = session
+        self._session = session
+        self._owns_session = session is None
+        self.connection_options = connection_options or ConnectionOptions()
+        self.instrumentation = instrumentation or Instrumentation()
+        self.refresh_before_expiry = refresh_before_expiry
+        self.shared_cameras_limiter = shared_cameras_limiter or AdaptiveLimiter()
+        self.cache = cache
+        self.shared_cameras_tracker = SharedCamerasTracker(shared_cameras_schedule) if shared_cameras_schedule else None
+        self.conditional_requests = conditional_requests or ConditionalRequests()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers or CircuitBreakers()
+        self.request_semaphores = tuple(request_semaphores)
+        self.camera_parser = camera_parser
+        self.json_decoder = json_decoder or default_json_decoder()
+        self.snapshot_store = snapshot_store
+        self.snapshot_interval = snapshot_interval
+        self._snapshots_loaded: set[str] = set()
+        self._snapshots_saved: Dict[str, Tuple[List[Camera], float]] = {}
+        self._snapshot_saves = SingleFlight()
+        self.token_store = token_store
+        self._rejected_authorization: str | None = None
         self.headers = {'Content-Type': 'application/json'}
         self.expires_at = datetime.now() - timedelta(seconds=1)
+        self._single_flight = SingleFlight()
+        self._reads = SingleFlight()
+        self.coalesced_calls = 0
+
+    @property
+    def session(self) -> ClientSession:
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = self.connection_options.create_session(self.shared_cameras_limiter.max_limit)
+        return self._session
+
+    async def __aenter__(self) -> 'SpypointApi':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        # snapshots still being written are kept for the next start
+        await self._snapshot_saves.wait()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def warm_up(self, connections: int | None = None) -> None:
+        # log in and open keep-alive connections so the first shared cameras burst skips TLS handshakes
+        connections = connections or self.shared_cameras_limiter.limit
+        await asyncio.gather(self.async_authenticate(),
+                             *(self._async_open_connection() for _ in range(connections - 1)))
+
+    async def _async_open_connection(self) -> None:
+        try:
+            async with self.session.head(self.base_url) as response:
+                await response.read()
+        except (ClientError, asyncio.TimeoutError) as error:
+            LOGGER.debug(f"warm up : could not open connection: {error!r}")
 
     async def async_authenticate(self):
-        if datetime.now() < self.expires_at:
+        now = datetime.now()
+        if now < self.expires_at - self.refresh_before_expiry:
+            return
+
+        if now < self.expires_at:
+            # token still valid, renew it in the background without delaying the caller
+            self._single_flight.start('login', self._async_login)
             return
 
+        await self._single_flight.run('login', self._async_login)
+
+    async def _async_login(self):
+        if self.token_store is None:
+            await self._async_post_login()
+            return
+
+        # the first process to take the lock logs in, the others adopt the token it stored
+        async with self.token_store.lock(self.username):
+            stored = await self.token_store.load(self.username)
+            if (stored is not None and 'Bearer ' + stored.token != self._rejected_authorization
+                    and datetime.now() < stored.expires_at - self.refresh_before_expiry):
+                self._use_token(stored)
+                return
+
+            await self.token_store.save(self.username, await self._async_post_login())
+
+    async def _async_post_login(self) -> StoredToken:
         json = {'username': self.username, 'password': self.password}
-        async with self.session.post(f'{self.base_url}/user/login', json=json, headers=self.headers) as response:
+
+        async def post() -> ClientResponse:
+            response = await self.session.post(f'{self.base_url}/user/login', json=json, headers=self.headers)
             await self._log('/user/login', response, self.headers, json)
-            self._raise_on_authenticate_error(response)
-            body = await response.json()
-            jwt_token = body['token']
-            claimset = jwt.decode(jwt_token, options={"verify_signature": False})
-            self.headers['Authorization'] = 'Bearer ' + jwt_token
-            self.expires_at = datetime.fromtimestamp(claimset['exp'])
+            return response
+
+        with self.instrumentation.request('POST', '/user/login') as event:
+            async with self._async_send('/user/login', post, event) as response:
+                self._raise_on_authenticate_error(response)
+                body = await response.read()
+                event.bytes = len(body)
+                jwt_token = self.json_decoder(body)['token']
+                claimset = jwt.decode(jwt_token, options={"verify_signature": False})
+                token = StoredToken(jwt_token, datetime.fromtimestamp(claimset['exp']))
+                self._use_token(token)
+                return token
+
+    def _use_token(self, token: StoredToken) -> None:
+        self.headers['Authorization'] = 'Bearer ' + token.token
+        self.expires_at = token.expires_at
 
     @staticmethod
     def _raise_on_authenticate_error(response: ClientResponse):
@@ -45,44 +172,355 @@ class SpypointApi:
             raise SpypointApiError(response)
 
     async def async_get_cameras(self) -> List[Camera]:
-        own_cameras = await self.async_get_own_cameras()
-        shared_cameras = await self.async_get_shared_cameras()
+        return await self._async_coalesced('cameras', self._async_get_cameras)
+
+    async def _async_get_cameras(self) -> List[Camera]:
+        own_cameras, shared_cameras = await asyncio.gather(self.async_get_own_cameras(),
+                                                           self.async_get_shared_cameras())
+        return own_cameras + shared_cameras
+
+    async def async_get_cameras_with_errors(self) -> CamerasResult:
+        errors: List[CamerasSourceError] = []
+        own_cameras, shared_cameras = await asyncio.gather(
+            self._async_collect_errors('/camera/all', self.async_get_own_cameras(), errors),
+            self._async_collect_errors('/shared-cameras/all', self._async_get_shared_cameras(errors), errors))
+        return CamerasResult(own_cameras + shared_cameras, errors)
+
+    @staticmethod
+    async def _async_collect_errors(source: str, get_cameras: Awaitable[List[Camera]],
+                                    errors: List[CamerasSourceError]) -> List[Camera]:
+        try:
+            return await get_cameras
+        except Exception as error:
+            errors.append(CamerasSourceError(source, error))
+            return []
+
+    async def watch(self, schedule: RefreshSchedule | None = None) -> AsyncIterator[CameraEvent]:
+        # shared cameras are only fetched again when their schedule says they may have changed,
+        # a tracker made for this watch ends with it so other reads still fetch every camera
+        tracker = self.shared_cameras_tracker or SharedCamerasTracker(schedule or RefreshSchedule())
+        schedule = schedule or tracker.schedule
+
+        known_cameras: Dict[str, Camera] = {}
+        while True:
+            try:
+                cameras = await self._async_get_tracked_cameras(tracker)
+            except SpypointApiInvalidCredentialsError:
+                raise
+            except (ClientError, asyncio.TimeoutError) as error:
+                LOGGER.debug(f"watch : poll failed, retrying in {schedule.min_interval}: {error!r}")
+                await asyncio.sleep(schedule.min_interval.total_seconds())
+                continue
+
+            for event in camera_events(known_cameras, cameras):
+                yield event
+            known_cameras = {camera.id: camera for camera in cameras}
+
+            now = datetime.now().astimezone()
+            next_poll = min((schedule.interval(camera, now) for camera in cameras), default=schedule.max_interval)
+            await asyncio.sleep(next_poll.total_seconds())
+
+    async def _async_get_tracked_cameras(self, tracker: SharedCamerasTracker) -> List[Camera]:
+        if tracker is self.shared_cameras_tracker:
+            return await self.async_get_cameras()
+        own_cameras, shared_cameras = await asyncio.gather(self.async_get_own_cameras(),
+                                                           self._async_fetch_shared_cameras(tracker=tracker))
         return own_cameras + shared_cameras
 
     async def async_get_own_cameras(self) -> List[Camera]:
-        async with await self._get('/camera/all') as response:
-            body = await response.json()
-            return CameraApiResponse.from_json(body)
+        return await self._async_coalesced('/camera/all', lambda: self._async_from_snapshot(
+            '/camera/all', lambda: self._async_cached('/camera/all', self._async_fetch_own_cameras)))
+
+    async def _async_fetch_own_cameras(self) -> List[Camera]:
+        cameras = list(await self._async_get_json('/camera/all', self.camera_parser.from_json))
+        self._save_snapshot('/camera/all', cameras)
+        return cameras
+
+    async def async_iter_own_cameras(self) -> AsyncIterator[Camera]:
+        # cameras are parsed as their element completes, the body and the full list of dicts are never held at once
+        context = CameraParseContext()
+        stream = JsonArrayStream()
+        with self.instrumentation.request('GET', '/camera/all') as event:
+            async with self._get('/camera/all', event, read_body=False) as response:
+                async for chunk in response.content.iter_any():
+                    event.bytes += len(chunk)
+                    for data in stream.feed(chunk):
+                        yield self.camera_parser.camera_from_json(data, context)
+                for data in stream.close():
+                    yield self.camera_parser.camera_from_json(data, context)
 
     async def async_get_shared_cameras(self) -> List[Camera]:
-        async with await self._get('/shared-cameras/all') as response:
-            body = await response.json()
-            camera_ids = SharedCamerasApiResponse.from_json(body)
-            gets_by_id = [self._async_get_shared_camera(camera_id) for camera_id in camera_ids]
-            return await asyncio.gather(*gets_by_id)
+        return await self._async_coalesced('/shared-cameras/all', lambda: self._async_from_snapshot(
+            '/shared-cameras/all', self._async_get_shared_cameras))
+
+    async def _async_get_shared_cameras(self, errors: List[CamerasSourceError] | None = None) -> List[Camera]:
+        if errors is None:
+            return await self._async_cached('/shared-cameras/all', self._async_fetch_shared_cameras)
+
+        # partial results are never cached, a complete refresh still updates the cache
+        errors_before = len(errors)
+        cameras = await self._async_fetch_shared_cameras(errors)
+        if len(errors) == errors_before:
+            if self.cache is not None:
+                self.cache.put('/shared-cameras/all', cameras)
+            self._save_snapshot('/shared-cameras/all', cameras)
+        return list(cameras)
+
+    async def _async_fetch_shared_cameras(self, errors: List[CamerasSourceError] | None = None,
+                                          tracker: SharedCamerasTracker | None = None) -> List[Camera]:
+        tracker = tracker or self.shared_cameras_tracker
+        camera_ids = await self._async_get_json('/shared-cameras/all', SharedCamerasApiResponse.from_json)
+
+        if tracker is None:
+            cameras = await self._async_get_shared_cameras_by_id(camera_ids, errors)
+        else:
+            now = datetime.now().astimezone()
+            camera_ids_to_refresh = tracker.camera_ids_to_refresh(camera_ids, now)
+            for camera in await self._async_get_shared_cameras_by_id(camera_ids_to_refresh, errors):
+                tracker.update(camera, now)
+            cameras = tracker.cameras(camera_ids)
+
+        if errors is None:
+            self._save_snapshot('/shared-cameras/all', cameras)
+        return cameras
+
+    async def _async_get_shared_cameras_by_id(self, camera_ids: List[str],
+                                              errors: List[CamerasSourceError] | None) -> List[Camera]:
+        gets_by_id = [self._async_get_shared_camera(camera_id) for camera_id in camera_ids]
+        if errors is None:
+            return list(await asyncio.gather(*gets_by_id))
+
+        cameras = []
+        for camera_id, result in zip(camera_ids, await asyncio.gather(*gets_by_id, return_exceptions=True)):
+            if isinstance(result, Exception):
+                errors.append(CamerasSourceError(f'/shared-cameras/{camera_id}', result))
+            else:
+                cameras.append(result)
+        return cameras
+
+    async def _async_coalesced(self, key: str, get: Callable[[], Awaitable[List[Camera]]]) -> List[Camera]:
+        # concurrent identical reads share one in-flight call, cancelled once all of its callers gave up
+        if self._reads.in_flight(key):
+            self.coalesced_calls += 1
+        return list(await self._reads.join(key, get))
+
+    async def _async_cached(self, key: str, fetch: Callable[[], Awaitable[List[Camera]]]) -> List[Camera]:
+        if self.cache is None:
+            return await fetch()
+        return list(await self.cache.get(key, fetch))
+
+    async def _async_from_snapshot(self, source: str, get: Callable[[], Awaitable[List[Camera]]]) -> List[Camera]:
+        if self.snapshot_store is None or source in self._snapshots_loaded:
+            return await get()
+
+        # serve the last snapshot at startup and refresh it in the background
+        self._snapshots_loaded.add(source)
+        try:
+            snapshot = await self.snapshot_store.load(self.username, source)
+        except Exception as error:
+            # the store only speeds up startup, a store that cannot be read is a cold start
+            LOGGER.debug(f"{source} : ignoring snapshot store that failed to load: {error!r}")
+            snapshot = None
+        if snapshot is None:
+            return await get()
+
+        if source == '/shared-cameras/all' and self.shared_cameras_tracker is not None:
+            stored_at = snapshot.stored_at.astimezone()
+            for camera in snapshot.cameras:
+                self.shared_cameras_tracker.update(camera, stored_at)
+        self._single_flight.start(f'snapshot {source}', lambda: self._async_refresh_snapshot(source, get))
+        return list(snapshot.cameras)
+
+    @staticmethod
+    async def _async_refresh_snapshot(source: str, get: Callable[[], Awaitable[List[Camera]]]) -> None:
+        try:
+            await get()
+        except Exception as error:
+            LOGGER.debug(f"{source} : background refresh of snapshot failed: {error!r}")
+            raise
+
+    def _save_snapshot(self, source: str, cameras: List[Camera]) -> None:
+        if self.snapshot_store is None:
+            return
+        saved = self._snapshots_saved.get(source)
+        now = time.monotonic()
+        if saved is not None and (self._same_cameras(saved[0], cameras)
+                                  or now - saved[1] < self.snapshot_interval.total_seconds()):
+            # a 304 or a reused parse gives back the cameras already written, and writes are spaced out anyway
+            return
+
+        # written in the background, a poll does not wait for the whole fleet to be serialized
+        self._snapshots_saved[source] = (cameras, now)
+        self._snapshot_saves.start(source, lambda: self._async_save_snapshot(source, cameras))
+
+    @staticmethod
+    def _same_cameras(saved: List[Camera], cameras: List[Camera]) -> bool:
+        return len(saved) == len(cameras) and all(a is b for a, b in zip(saved, cameras))
+
+    async def _async_save_snapshot(self, source: str, cameras: List[Camera]) -> None:
+        try:
+            await self.snapshot_store.save(self.username, source, cameras)
+        except Exception as error:
+            LOGGER.debug(f"{source} : skipping snapshot that failed to save: {error!r}")
+
+    def invalidate_cache(self, url: str | None = None) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(url)
 
     async def _async_get_shared_camera(self, camera_id) -> Camera:
-        async with await self._get(f'/shared-cameras/{camera_id}') as response:
-            body = await response.json()
+        def camera_from_json(body: Dict[str, Any]) -> Camera:
             body['id'] = camera_id
-            return CameraApiResponse.camera_from_json(body)
+            return self.camera_parser.camera_from_json(body)
+
+        queued = time.monotonic()
+        async with self.shared_cameras_limiter.slot() as limiter_slot:
+            return await self._async_get_json(f'/shared-cameras/{camera_id}', camera_from_json,
+                                              timedelta(seconds=time.monotonic() - queued), limiter_slot)
+
+    async def _async_get_json(self, url: str, parse: Callable[[Any], T], queued_for: timedelta = timedelta(0),
+                              limiter_slot: LimiterSlot | None = None) -> T:
+        with self.instrumentation.request('GET', url) as event:
+            event.queue_time += queued_for
+            stored = self.conditional_requests.lookup(url)
+            headers = self.conditional_requests.headers_for(url, stored)
+            async with self._get(url, event, headers, limiter_slot=limiter_slot) as response:
+                if response.status == HTTPStatus.NOT_MODIFIED and stored is not None:
+                    return self.conditional_requests.not_modified(url, stored)
+
+                body = await response.read()
+                event.bytes = len(body)
+                result = parse(self.json_decoder(body))
+                self.conditional_requests.store(url, response.headers, len(body), result)
+                return result
 
-    async def _get(self, url: str) -> ClientResponse:
-        await self.async_authenticate()
-        response = await self.session.get(f'{self.base_url}{url}', headers=self.headers)
-        await self._log(url, response, self.headers)
-        self._raise_on_get_error(response)
-        return response
+    @asynccontextmanager
+    async def _get(self, url: str, event: RequestEvent, extra_headers: Dict[str, str] | None = None,
+                   read_body: bool = True, limiter_slot: LimiterSlot | None = None) -> AsyncIterator[ClientResponse]:
+        async def get() -> ClientResponse:
+            headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+            response = await self.session.get(f'{self.base_url}{url}', headers=headers)
+            await self._log(url, response, headers, read_body=read_body)
+            return response
+
+        await self._async_timed_authenticate(event)
+        async with self._async_send(url, get, event, limiter_slot) as response:
+            if response.status != HTTPStatus.UNAUTHORIZED or not self.retry_policy.relogin_on_unauthorized:
+                self._raise_on_get_error(response)
+                yield response
+                return
+            self._expire_token(response)
+
+        # the token may have been revoked before its expiry, log in again and replay once
+        await self._async_timed_authenticate(event)
+        async with self._async_send(url, get, event, limiter_slot) as response:
+            self._raise_on_get_error(response)
+            yield response
+
+    async def _async_timed_authenticate(self, event: RequestEvent) -> None:
+        started = time.monotonic()
+        try:
+            await self.async_authenticate()
+        finally:
+            event.auth_time += timedelta(seconds=time.monotonic() - started)
+
+    @asynccontextmanager
+    async def _async_send(self, url: str, send: Callable[[], Awaitable[ClientResponse]], event: RequestEvent,
+                          limiter_slot: LimiterSlot | None = None) -> AsyncIterator[ClientResponse]:
+        circuit_breaker = self.circuit_breakers.for_url(url)
+        for attempt in itertools.count(1):
+            probing = circuit_breaker.before_request()
+            started = time.monotonic()
+            event.attempts += 1
+            # the slot is held until the response is released, body included
+            async with self._request_slot():
+                event.queue_time += timedelta(seconds=time.monotonic() - started)
+                response = None
+                error = None
+                try:
+                    response = await send()
+                except RETRYABLE_ERRORS as send_error:
+                    error = send_error
+                except BaseException:
+                    # cancellations and caller side errors are not server failures
+                    circuit_breaker.record_abandoned(probing)
+                    raise
+
+                status = response.status if response is not None else None
+                event.status = status
+                if limiter_slot is not None:
+                    # every throttled attempt counts, even one a retry recovers from
+                    limiter_slot.record_status(status)
+                if error is not None or self._is_server_failure(status):
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.record_success()
+
+                retry = self.retry_policy.should_retry(attempt, status, error)
+                retry_in = None
+                if retry:
+                    retry_after = response.headers.get('Retry-After') if response is not None else None
+                    retry_in = self.retry_policy.delay(attempt, retry_after)
+                self.retry_policy.report(RetryAttempt(url, attempt, status,
+                                                      timedelta(seconds=time.monotonic() - started), retry_in, error))
+
+                if not retry:
+                    if error is not None:
+                        raise error
+                    async with response:
+                        yield response
+                    return
+
+                if response is not None:
+                    response.release()
+
+            if limiter_slot is None:
+                await asyncio.sleep(retry_in.total_seconds())
+            else:
+                async with limiter_slot.released():
+                    await asyncio.sleep(retry_in.total_seconds())
+
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        acquired = []
+        try:
+            for semaphore in self.request_semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+            yield
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+    @staticmethod
+    def _is_server_failure(status: int) -> bool:
+        return status == HTTPStatus.TOO_MANY_REQUESTS or status >= HTTPStatus.INTERNAL_SERVER_ERROR
 
     def _raise_on_get_error(self, response: ClientResponse):
         if response.status == HTTPStatus.UNAUTHORIZED:
-            self.expires_at = datetime.now() - timedelta(seconds=1)
-            del self.headers['Authorization']
+            self._expire_token(response)
 
         if not response.ok:
             raise SpypointApiError(response)
 
-    @staticmethod
-    async def _log(url: str, response: ClientResponse, headers: dict, json: dict = None) -> None:
-        LOGGER.debug(
-            f"{url} : Request[[ headers=[{headers}] body=[{json}] ]] - Response[[ status=[{response.status}] headers=[{dict(response.headers)}] body=[{await response.text()}] ]]")
+    def _expire_token(self, response: ClientResponse):
+        # a concurrent request may already have replaced the rejected token with a new one
+        rejected_authorization = response.request_info.headers.get('Authorization')
+        if self.headers.get('Authorization') == rejected_authorization:
+            self.expires_at = datetime.now() - timedelta(seconds=1)
+            self.headers.pop('Authorization', None)
+            # other processes may still hold the revoked token in the store, never adopt it again
+            self._rejected_authorization = rejected_authorization
+
+    async def _log(self, url: str, response: ClientResponse, headers: dict, json: dict = None,
+                   read_body: bool = True) -> None:
+        if not LOGGER.isEnabledFor(DEBUG):
+            return
+        # bodies are only read and formatted when explicitly enabled, and then capped
+        if not self.instrumentation.log_bodies:
+            request_body = response_body = '<not logged>'
+        else:
+            request_body = self.instrumentation.log_body(None if json is None else str(json))
+            response_body = self.instrumentation.log_body(await response.read()) if read_body else '<streamed>'
+        LOGGER.debug(f"{url} : Request[[ headers=[{headers}] body=[{request_body}] ]] - "
+                     f"Response[[ status=[{response.status}] headers=[{dict(response.headers)}] "
+                     f"body=[{response_body}] ]]")
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import aiohttp
 
 
@@ -12,3 +14,17 @@ class SpypointApiError(aiohttp.ClientResponseError):
 
 class SpypointApiInvalidCredentialsError(SpypointApiError):
     pass
+
+
+class SpypointApiCircuitOpenError(SpypointApiError):
+    def __init__(self, endpoint: str, retry_in: timedelta):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        self.request_info = None
+        self.history = ()
+        self.status = 0
+        self.message = f"circuit open for {endpoint}, retry in {retry_in}"
+        self.headers = None
+
+    def __str__(self) -> str:
+        return self.message
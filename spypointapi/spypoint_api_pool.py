@@ -0,0 +1,78 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+from aiohttp import ClientSession
+
+from . import Camera
+from .cameras.camera_parse_cache import CameraParseCache
+from .spypoint_api import SpypointApi
+
+# keyed by url or camera id only, an instance shared by two accounts would mix their cameras
+PER_ACCOUNT_OPTIONS = ('cache', 'conditional_requests')
+
+
+@dataclass()
+class AccountResult:
+    username: str
+    cameras: List[Camera] = field(default_factory=list)
+    error: Exception | None = None
+
+
+class SpypointApiPool:
+
+    def __init__(self, session: ClientSession, max_in_flight: int = 50, max_in_flight_per_account: int = 4,
+                 account_options: Callable[[], Dict[str, Any]] | None = None, **api_options: Any):
+        shared_state = [name for name in PER_ACCOUNT_OPTIONS if name in api_options]
+        if isinstance(api_options.get('camera_parser'), CameraParseCache):
+            shared_state.append('camera_parser')
+        if shared_state:
+            raise ValueError(f'{", ".join(shared_state)} must be built per account, pass them through account_options')
+        self.session = session
+        self.max_in_flight_per_account = max_in_flight_per_account
+        self.api_options = api_options
+        self.account_options = account_options
+        self.accounts: Dict[str, SpypointApi] = {}
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+
+    def add_account(self, username: str, password: str) -> SpypointApi:
+        # the account limit is acquired first so an account waiting for a global slot does not block the others
+        api = SpypointApi(username, password, self.session,
+                          request_semaphores=(asyncio.Semaphore(self.max_in_flight_per_account), self._in_flight),
+                          **self.api_options, **(self.account_options() if self.account_options else {}))
+        self.accounts[username] = api
+        return api
+
+    def remove_account(self, username: str) -> None:
+        self.accounts.pop(username, None)
+
+    async def poll(self, spread: timedelta = timedelta(0)) -> AsyncIterator[AccountResult]:
+        accounts = list(self.accounts.values())
+        if not accounts:
+            return
+
+        step = spread.total_seconds() / len(accounts)
+        polls = [asyncio.create_task(self._async_poll_account(api, index * step)) for index, api in enumerate(accounts)]
+        try:
+            for next_poll in asyncio.as_completed(polls):
+                yield await next_poll
+        finally:
+            for poll in polls:
+                poll.cancel()
+
+    async def poll_every(self, interval: timedelta) -> AsyncIterator[AccountResult]:
+        while True:
+            started = time.monotonic()
+            async for result in self.poll(spread=interval):
+                yield result
+            await asyncio.sleep(max(interval.total_seconds() - (time.monotonic() - started), 0))
+
+    @staticmethod
+    async def _async_poll_account(api: SpypointApi, delay: float) -> AccountResult:
+        await asyncio.sleep(delay)
+        try:
+            return AccountResult(api.username, await api.async_get_cameras())
+        except Exception as error:
+            return AccountResult(api.username, error=error)
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from os import PathLike
+from pathlib import Path
+from typing import AsyncContextManager, AsyncIterator, Dict, IO, Protocol
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+@dataclass(frozen=True)
+class StoredToken:
+    token: str
+    expires_at: datetime
+
+
+class TokenStore(Protocol):
+
+    async def load(self, account: str) -> StoredToken | None: ...
+
+    async def save(self, account: str, token: StoredToken) -> None: ...
+
+    def lock(self, account: str) -> AsyncContextManager[None]: ...
+
+
+class MemoryTokenStore:
+
+    def __init__(self):
+        self._tokens: Dict[str, StoredToken] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def load(self, account: str) -> StoredToken | None:
+        return self._tokens.get(account)
+
+    async def save(self, account: str, token: StoredToken) -> None:
+        self._tokens[account] = token
+
+    def lock(self, account: str) -> AsyncContextManager[None]:
+        return self._locks.setdefault(account, asyncio.Lock())
+
+
+class FileTokenStore:
+
+    def __init__(self, path: str | PathLike[str]):
+        if fcntl is None:
+            raise RuntimeError('FileTokenStore needs fcntl file locks, which are not available on this platform')
+        self.path = Path(path)
+        self._lock_path = self.path.with_name(self.path.name + '.lock')
+        self._process_lock = asyncio.Lock()
+
+    async def load(self, account: str) -> StoredToken | None:
+        token = (await asyncio.to_thread(self._read)).get(account)
+        if token is None:
+            return None
+        return StoredToken(token['token'], datetime.fromtimestamp(token['expires_at']))
+
+    async def save(self, account: str, token: StoredToken) -> None:
+        # read-modify-write, callers hold lock() so no other process writes in between
+        await asyncio.to_thread(self._write, account, token)
+
+    @asynccontextmanager
+    async def lock(self, account: str) -> AsyncIterator[None]:
+        # one file lock for all accounts, logins are rare enough that finer locks are not worth it
+        async with self._process_lock:
+            acquire = asyncio.ensure_future(asyncio.to_thread(self._acquire))
+            try:
+                lock_file = await asyncio.shield(acquire)
+            except asyncio.CancelledError:
+                # the thread still takes the lock, give it back as soon as it does
+                acquire.add_done_callback(self._release_acquired)
+                raise
+            try:
+                yield
+            finally:
+                self._release(lock_file)
+
+    def _read(self) -> Dict[str, Dict[str, float | str]]:
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, account: str, token: StoredToken) -> None:
+        tokens = self._read()
+        tokens[account] = {'token': token.token, 'expires_at': token.expires_at.timestamp()}
+        temporary_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        with open(os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as file:
+            json.dump(tokens, file)
+        # readers see either the previous file or the new one, never a partial write
+        os.replace(temporary_path, self.path)
+
+    def _acquire(self) -> IO[str]:
+        lock_file = open(self._lock_path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        except BaseException:
+            lock_file.close()
+            raise
+        return lock_file
+
+    def _release_acquired(self, acquire: asyncio.Future) -> None:
+        if not acquire.cancelled() and acquire.exception() is None:
+            self._release(acquire.result())
+
+    @staticmethod
+    def _release(lock_file: IO[str]) -> None:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
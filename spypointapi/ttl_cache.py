@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from logging import Logger, getLogger
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from .single_flight import SingleFlight
+
+LOGGER: Logger = getLogger(__package__)
+
+
+@dataclass()
+class CacheEntry:
+    value: Any
+    stored_at: float
+
+
+class TtlCache:
+
+    def __init__(self,
+                 ttl: timedelta = timedelta(seconds=30),
+                 ttls: Dict[Hashable, timedelta] | None = None,
+                 stale_while_revalidate: timedelta = timedelta(minutes=5),
+                 max_entries: int = 128,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._generation = 0
+        self._generations: Dict[Hashable, int] = {}
+        self._refreshes = SingleFlight()
+
+    def ttl_for(self, key: Hashable) -> timedelta:
+        return self.ttls.get(key, self.ttl)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self.clock() - entry.stored_at
+            ttl = self.ttl_for(key).total_seconds()
+            if age < ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if age < ttl + self.stale_while_revalidate.total_seconds():
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._refreshes.start(key, lambda: self._fetch(key, fetch, background=True))
+                return entry.value
+
+        self.misses += 1
+        return await self._refreshes.join(key, lambda: self._fetch(key, fetch))
+
+    def put(self, key: Hashable, value: Any, stored_at: float | None = None) -> None:
+        self._entries[key] = CacheEntry(value, self.clock() if stored_at is None else stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        # fetches started before the invalidation must not store their result
+        if key is None:
+            self._entries.clear()
+            self._generation += 1
+        else:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def _generation_of(self, key: Hashable) -> tuple[int, int]:
+        return self._generation, self._generations.get(key, 0)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], background: bool = False) -> Any:
+        generation = self._generation_of(key)
+        try:
+            value = await fetch()
+        except Exception as error:
+            if background:
+                LOGGER.debug(f"{key} : background refresh failed, keeping stale value: {error!r}")
+            raise
+        if self._generation_of(key) == generation:
+            self.put(key, value)
+        return value
@@ -1,7 +1,8 @@
 import unittest
 from datetime import datetime, timedelta
 
-from spypointapi import Camera
+from spypointapi import Camera, Coordinates
+from spypointapi.cameras.camera import TransmitTime
 
 
 class CameraTest(unittest.TestCase):
@@ -20,4 +21,15 @@ class CameraTest(unittest.TestCase):
                         last_update_time=datetime.now().astimezone() - timedelta(hours=24, minutes=0, seconds=1),
                         signal=100, temperature=20, battery=200, memory=100)
 
-        self.assertEqual(camera.is_online, False)
\ No newline at end of file
+        self.assertEqual(camera.is_online, False)
+
+    def test_has_no_instance_dict(self):
+        camera = Camera(id="id", name="name", model="model",
+                        modem_firmware="modem_firmware", camera_firmware="camera_firmware",
+                        last_update_time=datetime.now().astimezone())
+
+        self.assertFalse(hasattr(camera, '__dict__'))
+
+    def test_coordinates_and_transmit_time_are_hashable_values(self):
+        self.assertEqual(len({Coordinates(45.1, -70.1), Coordinates(45.1, -70.1)}), 1)
+        self.assertEqual(len({TransmitTime(6, 0), TransmitTime(6, 0)}), 1)
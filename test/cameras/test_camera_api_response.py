@@ -1,8 +1,9 @@
+import json
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from spypointapi.cameras.camera import Coordinates, TransmitTime
-from spypointapi.cameras.camera_api_response import CameraApiResponse
+from spypointapi.cameras.camera_api_response import CameraApiResponse, CameraParseContext, local_datetime_from_json
 
 
 class TestCameraApiResponse(unittest.TestCase):
@@ -343,3 +344,59 @@ class TestCameraApiResponse(unittest.TestCase):
         self.assertEqual(camera.hd_photo_count, None)
         self.assertEqual(camera.hd_photo_limit, None)
 
+    def test_parses_batch_like_single_cameras(self):
+        data = [
+            {
+                "id": "1",
+                "activationDate": "2024-09-30T01:02:03.456Z",
+                "config": {"name": "camera 1", "sensibility": {"level": "low"}},
+                "status": {"model": "model", "lastUpdate": "2024-10-30T02:03:48.716Z", "batteries": [0, 90]},
+                "subscriptions": [{"photoCount": 4, "photoLimit": 250}],
+            },
+            {
+                "id": "2",
+                "config": {"name": "camera 2"},
+                "status": {"model": "model", "lastUpdate": "2024-10-30T02:03:48.716Z"},
+            },
+        ]
+
+        self.assertEqual(CameraApiResponse.from_json(data), [CameraApiResponse.camera_from_json(d) for d in data])
+
+    def test_parses_dates_in_context_timezone(self):
+        timezone = datetime.now().astimezone().tzinfo
+        camera = CameraApiResponse.camera_from_json(
+            {
+                "id": "id",
+                "config": {"name": "name"},
+                "status": {"model": "model", "lastUpdate": "2024-10-30T02:03:48.716Z"},
+                "creationDate": "2024-09-20T10:00:00.000Z",
+            },
+            CameraParseContext(timezone)
+        )
+
+        self.assertIs(camera.last_update_time.tzinfo, timezone)
+        self.assertIs(camera.creation_date.tzinfo, timezone)
+
+    def test_attaches_timezone_like_replace(self):
+        eastern = timezone(timedelta(hours=-4), 'EDT')
+        for date_str in ("2024-10-30T02:03:48.716", "2024-10-30T02:03:48", "2024-10-30T02:03:48+02:00"):
+            expected = datetime.fromisoformat(date_str).replace(tzinfo=eastern)
+
+            parsed = local_datetime_from_json(date_str, eastern)
+
+            self.assertEqual(parsed, expected)
+            self.assertEqual(repr(parsed), repr(expected))
+            self.assertIs(parsed.tzinfo, eastern)
+
+    def test_shares_repeated_strings_between_cameras(self):
+        def camera_json(camera_id):
+            return json.loads(json.dumps({
+                "id": camera_id,
+                "config": {"name": "name", "captureMode": "photo"},
+                "status": {"model": "FLEX-" + "S", "lastUpdate": "2024-10-30T02:03:48.716Z"},
+            }))
+
+        first, second = CameraApiResponse.from_json([camera_json("1"), camera_json("2")])
+
+        self.assertIs(first.model, second.model)
+        self.assertIs(first.capture_mode, second.capture_mode)
@@ -0,0 +1,36 @@
+import unittest
+from dataclasses import replace
+from datetime import datetime
+
+from spypointapi import Camera, CameraAdded, CameraChanged, CameraRemoved
+from spypointapi.cameras.camera_events import camera_events
+
+
+class TestCameraEvents(unittest.TestCase):
+    now = datetime.now().astimezone()
+
+    def test_reports_added_cameras(self):
+        camera = self.camera('1')
+
+        self.assertEqual(camera_events({}, [camera]), [CameraAdded(camera)])
+
+    def test_reports_removed_cameras(self):
+        camera = self.camera('1')
+
+        self.assertEqual(camera_events({'1': camera}, []), [CameraRemoved(camera)])
+
+    def test_reports_changed_fields(self):
+        previous = self.camera('1')
+        current = replace(previous, battery=50, signal=20)
+
+        self.assertEqual(camera_events({'1': previous}, [current]),
+                         [CameraChanged(current, previous, frozenset({'battery', 'signal'}))])
+
+    def test_ignores_unchanged_cameras(self):
+        previous = self.camera('1')
+
+        self.assertEqual(camera_events({'1': previous}, [replace(previous)]), [])
+
+    def camera(self, camera_id: str) -> Camera:
+        return Camera(id=camera_id, name="name", model="model", modem_firmware="", camera_firmware="",
+                      last_update_time=self.now, battery=90, signal=80)
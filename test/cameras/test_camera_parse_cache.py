@@ -0,0 +1,68 @@
+import json
+import unittest
+
+from spypointapi import CameraParseCache
+
+
+class TestCameraParseCache(unittest.TestCase):
+
+    def test_reuses_camera_when_payload_is_unchanged(self):
+        cache = CameraParseCache()
+
+        first = cache.from_json([self.camera_json('1', 'camera')])
+        second = cache.from_json([self.camera_json('1', 'camera')])
+
+        self.assertIs(second[0], first[0])
+        self.assertEqual((cache.reused, cache.rebuilt), (1, 1))
+
+    def test_rebuilds_camera_when_payload_changed(self):
+        cache = CameraParseCache()
+
+        cache.from_json([self.camera_json('1', 'camera')])
+        cameras = cache.from_json([self.camera_json('1', 'renamed')])
+
+        self.assertEqual(cameras[0].name, 'renamed')
+        self.assertEqual((cache.reused, cache.rebuilt), (0, 2))
+
+    def test_tracks_cameras_by_id(self):
+        cache = CameraParseCache()
+
+        cache.from_json([self.camera_json('1', 'camera'), self.camera_json('2', 'camera')])
+        cache.from_json([self.camera_json('2', 'camera'), self.camera_json('1', 'camera')])
+
+        self.assertEqual((cache.reused, cache.rebuilt), (2, 2))
+
+    def test_reuses_camera_decoded_from_another_response(self):
+        cache = CameraParseCache()
+        body = json.dumps([self.camera_json('1', 'camera')])
+
+        first = cache.from_json(json.loads(body))
+        second = cache.from_json(json.loads(body))
+
+        self.assertIs(second[0], first[0])
+
+    def test_drops_cameras_that_left_the_fleet(self):
+        cache = CameraParseCache()
+
+        cache.from_json([self.camera_json('1', 'camera'), self.camera_json('2', 'camera')])
+        cache.from_json([self.camera_json('2', 'camera')])
+        cache.from_json([self.camera_json('1', 'camera'), self.camera_json('2', 'camera')])
+
+        self.assertEqual((cache.reused, cache.rebuilt), (2, 3))
+
+    def test_keeps_cameras_parsed_one_at_a_time(self):
+        cache = CameraParseCache()
+
+        shared = cache.camera_from_json(self.camera_json('shared', 'camera'))
+        cache.from_json([self.camera_json('1', 'camera')])
+        cache.from_json([self.camera_json('1', 'camera')])
+
+        self.assertIs(cache.camera_from_json(self.camera_json('shared', 'camera')), shared)
+
+    @staticmethod
+    def camera_json(camera_id, name):
+        return {
+            "id": camera_id,
+            "config": {"name": name, },
+            "status": {"model": "model", "lastUpdate": "2024-10-30T02:03:48.716Z", }
+        }
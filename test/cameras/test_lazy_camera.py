@@ -0,0 +1,72 @@
+import unittest
+
+from benchmarks.fleet_generator import FleetGenerator
+from spypointapi import LazyCamera, LazyCameraApiResponse
+from spypointapi.cameras.camera_api_response import CAMERA_FIELD_READERS, CameraApiResponse, CameraParseContext
+from spypointapi.cameras.lazy_camera import CAMERA_FIELDS
+
+
+class TestLazyCamera(unittest.TestCase):
+    data = {
+        "id": "id",
+        "ownerFirstName": "Philippe ",
+        "activationDate": "2024-09-30T01:02:03.456Z",
+        "isCellular": True,
+        "config": {
+            "name": "name",
+            "captureMode": "timeLapse",
+            "sensibility": {"level": "medium"},
+            "transmitFreq": 6,
+            "transmitTime": {"hour": 6, "minute": 0},
+        },
+        "status": {
+            "model": "model",
+            "lastUpdate": "2024-10-30T02:03:48.716Z",
+            "signal": {"processed": {"percentage": 77}},
+            "temperature": {"unit": "F", "value": 17},
+            "batteries": [0, 90, 0],
+            "memory": {"used": 100, "size": 1000},
+            "notifications": ["missing_sd_card"],
+            "coordinates": [{"position": {"type": "Point", "coordinates": [-70.1234, 45.123456]}}],
+        },
+        "subscriptions": [{"photoCount": 4, "photoLimit": 250, "hdPhotoCount": 0, "hdPhotoLimit": 100}],
+    }
+
+    def test_reads_like_eager_camera(self):
+        camera = LazyCamera(self.data)
+        expected = CameraApiResponse.camera_from_json(self.data)
+
+        self.assertEqual(camera, expected)
+        self.assertEqual(camera.to_camera(), expected)
+        self.assertEqual(camera.is_online, expected.is_online)
+        self.assertEqual(str(camera), str(expected))
+
+    def test_reads_every_field_like_eager_camera_on_generated_fleet(self):
+        context = CameraParseContext()
+        for data in FleetGenerator(seed=1).cameras(500):
+            camera = LazyCamera(data, context)
+            expected = CameraApiResponse.camera_from_json(data, context)
+
+            for name in CAMERA_FIELDS:
+                self.assertEqual(getattr(camera, name), getattr(expected, name), f"{data['id']} {name}")
+
+    def test_has_one_reader_per_camera_field(self):
+        self.assertEqual(tuple(CAMERA_FIELD_READERS), CAMERA_FIELDS)
+
+    def test_decodes_only_fields_that_are_read(self):
+        camera = LazyCamera({"id": "id", "status": {"lastUpdate": "invalid"}})
+
+        self.assertEqual(camera.id, "id")
+        self.assertEqual(camera.battery, None)
+
+    def test_memoizes_decoded_fields(self):
+        camera = LazyCamera(self.data)
+
+        self.assertIs(camera.coordinates, camera.coordinates)
+        self.assertIs(camera.last_update_time, camera.last_update_time)
+
+    def test_parses_lists_lazily(self):
+        cameras = LazyCameraApiResponse.from_json([self.data])
+
+        self.assertIsInstance(cameras[0], LazyCamera)
+        self.assertEqual(cameras, CameraApiResponse.from_json([self.data]))
@@ -0,0 +1,47 @@
+import unittest
+from datetime import datetime, timedelta
+
+from spypointapi import Camera, RefreshSchedule
+from spypointapi.cameras.camera import TransmitTime
+
+
+class TestRefreshSchedule(unittest.TestCase):
+    now = datetime.now().astimezone()
+    schedule = RefreshSchedule(min_interval=timedelta(minutes=1), max_interval=timedelta(hours=1),
+                               grace=timedelta(minutes=5))
+
+    def test_refreshes_after_next_expected_transmission(self):
+        camera = self.camera(last_update=timedelta(minutes=30), transmit_freq=1)
+
+        self.assertEqual(self.schedule.interval(camera, self.now), timedelta(minutes=35))
+
+    def test_refreshes_at_max_interval_for_infrequent_transmissions(self):
+        camera = self.camera(last_update=timedelta(minutes=30), transmit_freq=6)
+
+        self.assertEqual(self.schedule.interval(camera, self.now), timedelta(hours=1))
+
+    def test_refreshes_at_min_interval_when_transmission_is_overdue(self):
+        camera = self.camera(last_update=timedelta(hours=2), transmit_freq=1)
+
+        self.assertEqual(self.schedule.interval(camera, self.now), timedelta(minutes=1))
+
+    def test_refreshes_at_min_interval_for_instant_transmissions(self):
+        camera = self.camera(last_update=timedelta(minutes=30), transmit_freq=0)
+
+        self.assertEqual(self.schedule.interval(camera, self.now), timedelta(minutes=1))
+
+    def test_refreshes_at_max_interval_when_offline(self):
+        camera = self.camera(last_update=timedelta(days=2), transmit_freq=1)
+
+        self.assertEqual(self.schedule.interval(camera, self.now), timedelta(hours=1))
+
+    def test_expects_next_transmission_aligned_on_transmit_time(self):
+        camera = self.camera(last_update=timedelta(0), transmit_freq=4, transmit_time=TransmitTime(hour=6, minute=0))
+        camera.last_update_time = datetime(2024, 10, 30, 15, 12, tzinfo=self.now.tzinfo)
+
+        self.assertEqual(self.schedule.expected_update(camera), datetime(2024, 10, 30, 18, 0, tzinfo=self.now.tzinfo))
+
+    def camera(self, last_update: timedelta, transmit_freq: int, transmit_time: TransmitTime | None = None) -> Camera:
+        return Camera(id="id", name="name", model="model", modem_firmware="", camera_firmware="",
+                      last_update_time=self.now - last_update, transmit_freq=transmit_freq,
+                      transmit_time=transmit_time)
@@ -0,0 +1,33 @@
+import unittest
+from datetime import datetime, timedelta
+
+from spypointapi import Camera, RefreshSchedule
+from spypointapi.shared_cameras.shared_cameras_tracker import SharedCamerasTracker
+
+
+class TestSharedCamerasTracker(unittest.TestCase):
+    now = datetime.now().astimezone()
+
+    def setUp(self):
+        self.tracker = SharedCamerasTracker(RefreshSchedule(min_interval=timedelta(minutes=10)))
+
+    def test_refreshes_new_cameras(self):
+        self.assertEqual(self.tracker.camera_ids_to_refresh(['1', '2'], self.now), ['1', '2'])
+
+    def test_refreshes_cameras_when_due(self):
+        self.tracker.update(self.camera('1'), self.now)
+
+        self.assertEqual(self.tracker.camera_ids_to_refresh(['1'], self.now + timedelta(minutes=9)), [])
+        self.assertEqual(self.tracker.camera_ids_to_refresh(['1'], self.now + timedelta(minutes=10)), ['1'])
+
+    def test_drops_removed_cameras(self):
+        self.tracker.update(self.camera('1'), self.now)
+        self.tracker.update(self.camera('2'), self.now)
+
+        self.tracker.camera_ids_to_refresh(['2'], self.now)
+
+        self.assertEqual(self.tracker.cameras(['1', '2']), [self.camera('2')])
+
+    def camera(self, camera_id: str) -> Camera:
+        return Camera(id=camera_id, name="name", model="model", modem_firmware="", camera_firmware="",
+                      last_update_time=self.now)
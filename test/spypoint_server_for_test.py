@@ -24,25 +24,37 @@ class SpypointServerForTest:
         self.server.post(f'{self.base_url}/user/login', status=status, payload=body, repeat=repeat)
         return body.get('token')
 
-    def prepare_cameras_response(self, body=None, status=HTTPStatus.OK, repeat=True):
+    def prepare_cameras_response(self, body=None, status=HTTPStatus.OK, repeat=True, headers=None):
         if body is None:
             body = []
-        self.server.get(f'{self.base_url}/camera/all', status=status, payload=body, repeat=repeat)
+        self.server.get(f'{self.base_url}/camera/all', status=status, payload=body, repeat=repeat, headers=headers)
 
     def prepare_shared_cameras_response(self, body=None, status=HTTPStatus.OK, repeat=True):
         if body is None:
             body = []
         self.server.get(f'{self.base_url}/shared-cameras/all', status=status, payload=body, repeat=repeat)
 
-    def prepare_shared_camera_response(self, id, body=None, status=HTTPStatus.OK, repeat=True):
+    def prepare_shared_camera_response(self, id, body=None, status=HTTPStatus.OK, repeat=True, headers=None):
         if body is None:
             body = []
-        self.server.get(f'{self.base_url}/shared-cameras/{id}', status=status, payload=body, repeat=repeat)
+        self.server.get(f'{self.base_url}/shared-cameras/{id}', status=status, payload=body, repeat=repeat,
+                        headers=headers)
+
+    def prepare_warm_up_response(self, status=HTTPStatus.NOT_FOUND):
+        self.server.head(self.base_url, status=status, repeat=True)
+
+    def url(self, url) -> URL:
+        return URL(f'{self.base_url}{url}')
 
     def assert_called_with(self, url, method, *args, **kwargs):
         self.server.assert_called_with(f'{self.base_url}{url}', method, *args, **kwargs)
 
     def assert_called_n_times_with(self, times, url, method, headers, json):
-        key = (method, URL(f'{self.base_url}{url}'))
-        assert len(self.server.requests[key]) == times
+        self.assert_called_n_times(times, url, method)
         self.assert_called_with(url, method, headers=headers, json=json)
+
+    def assert_called_n_times(self, times, url, method):
+        assert self.call_count(url, method) == times
+
+    def call_count(self, url, method) -> int:
+        return len(self.server.requests.get((method, self.url(url)), []))
@@ -0,0 +1,128 @@
+import asyncio
+import unittest
+from http import HTTPStatus
+
+from aiohttp import ClientResponseError
+
+from spypointapi import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_bounds_concurrent_calls_and_reports_queue_depth(self):
+        limiter = AdaptiveLimiter(limit=2, max_limit=2)
+        release = asyncio.Event()
+
+        async def call():
+            async with limiter.slot():
+                await release.wait()
+
+        tasks = [asyncio.create_task(call()) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        self.assertEqual(limiter.in_flight, 2)
+        self.assertEqual(limiter.queue_depth, 3)
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(limiter.queue_depth, 0)
+
+    async def test_halves_limit_when_throttled(self):
+        limiter = AdaptiveLimiter(limit=8)
+
+        with self.assertRaises(ClientResponseError):
+            async with limiter.slot():
+                raise self.throttled_error()
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.throttled_count, 1)
+
+    async def test_decreases_once_for_requests_sent_at_the_same_limit(self):
+        limiter = AdaptiveLimiter(limit=8)
+        release = asyncio.Event()
+
+        async def throttled_call():
+            async with limiter.slot():
+                await release.wait()
+                raise self.throttled_error()
+
+        tasks = [asyncio.create_task(throttled_call()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.throttled_count, 3)
+
+    async def test_never_goes_below_min_limit(self):
+        limiter = AdaptiveLimiter(limit=2, min_limit=2)
+
+        with self.assertRaises(ClientResponseError):
+            async with limiter.slot():
+                raise self.throttled_error()
+
+        self.assertEqual(limiter.limit, 2)
+
+    async def test_grows_limit_after_a_window_of_successes(self):
+        limiter = AdaptiveLimiter(limit=2, max_limit=3)
+
+        for _ in range(10):
+            async with limiter.slot():
+                pass
+
+        self.assertEqual(limiter.limit, 3)
+
+    async def test_ignores_other_errors(self):
+        limiter = AdaptiveLimiter(limit=4)
+
+        with self.assertRaises(ClientResponseError):
+            async with limiter.slot():
+                raise ClientResponseError(None, (), status=HTTPStatus.NOT_FOUND)
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.throttled_count, 0)
+
+    async def test_counts_throttled_attempts_reported_by_the_slot(self):
+        limiter = AdaptiveLimiter(limit=8)
+
+        async with limiter.slot() as slot:
+            slot.record_status(HTTPStatus.TOO_MANY_REQUESTS)
+            slot.record_status(HTTPStatus.OK)
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.throttled_count, 1)
+
+    async def test_does_not_count_a_reported_throttle_twice(self):
+        limiter = AdaptiveLimiter(limit=8)
+
+        with self.assertRaises(ClientResponseError):
+            async with limiter.slot() as slot:
+                slot.record_status(HTTPStatus.TOO_MANY_REQUESTS)
+                raise self.throttled_error()
+
+        self.assertEqual(limiter.throttled_count, 1)
+
+    async def test_gives_slot_up_while_released(self):
+        limiter = AdaptiveLimiter(limit=1, max_limit=1)
+        other_ran = asyncio.Event()
+
+        async def other_call():
+            async with limiter.slot():
+                other_ran.set()
+
+        async with limiter.slot() as slot:
+            other = asyncio.create_task(other_call())
+            await asyncio.sleep(0)
+            self.assertEqual(limiter.queue_depth, 1)
+            async with slot.released():
+                await other_ran.wait()
+            self.assertEqual(limiter.in_flight, 1)
+
+        await other
+        self.assertEqual(limiter.in_flight, 0)
+
+    @staticmethod
+    def throttled_error():
+        return ClientResponseError(None, (), status=HTTPStatus.TOO_MANY_REQUESTS)
@@ -0,0 +1,107 @@
+import unittest
+from datetime import timedelta
+
+from spypointapi import CircuitBreakers, CircuitState, SpypointApiCircuitOpenError
+from spypointapi.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker('camera/all', failure_threshold=2, reset_timeout=timedelta(seconds=30),
+                                      clock=self.clock)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+    def test_success_resets_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+    def test_fails_fast_while_open(self):
+        self.open_breaker()
+        self.clock.now = 10
+
+        with self.assertRaises(SpypointApiCircuitOpenError) as context:
+            self.breaker.before_request()
+
+        self.assertEqual(context.exception.endpoint, 'camera/all')
+        self.assertEqual(context.exception.retry_in, timedelta(seconds=20))
+        self.assertEqual(self.breaker.rejected, 1)
+
+    def test_lets_one_probe_through_when_half_open(self):
+        self.open_breaker()
+        self.clock.now = 30
+
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.breaker.before_request()
+        with self.assertRaises(SpypointApiCircuitOpenError):
+            self.breaker.before_request()
+
+    def test_closes_when_probe_succeeds(self):
+        self.open_breaker()
+        self.clock.now = 30
+        self.breaker.before_request()
+
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+    def test_frees_probe_abandoned_by_the_caller(self):
+        self.open_breaker()
+        self.clock.now = 30
+
+        probing = self.breaker.before_request()
+        self.breaker.record_abandoned(probing)
+
+        self.assertTrue(probing)
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertTrue(self.breaker.before_request())
+
+    def test_opens_again_when_probe_fails(self):
+        self.open_breaker()
+        self.clock.now = 30
+        self.breaker.before_request()
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+    def open_breaker(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+
+class TestCircuitBreakers(unittest.TestCase):
+
+    def test_groups_urls_by_endpoint_family(self):
+        breakers = CircuitBreakers()
+
+        self.assertIs(breakers.for_url('/shared-cameras/all'), breakers.for_url('/shared-cameras/id1'))
+        self.assertEqual(breakers.for_url('/user/login').name, 'login')
+        self.assertEqual(breakers.for_url('/camera/all').name, 'camera/all')
+        self.assertEqual(breakers.for_url('/shared-cameras/id1').name, 'shared-cameras')
+
+    def test_exposes_states(self):
+        breakers = CircuitBreakers(failure_threshold=1)
+        breakers.for_url('/camera/all').record_failure()
+        breakers.for_url('/user/login').record_success()
+
+        self.assertEqual(breakers.states(), {'camera/all': CircuitState.OPEN, 'login': CircuitState.CLOSED})
+        self.assertEqual(breakers.state('shared-cameras'), CircuitState.CLOSED)
@@ -0,0 +1,52 @@
+import unittest
+
+from spypointapi import ConditionalRequests
+
+
+class TestConditionalRequests(unittest.TestCase):
+
+    def test_sends_no_validators_for_unknown_url(self):
+        self.assertEqual(ConditionalRequests().headers_for('/camera/all'), {})
+
+    def test_sends_stored_validators(self):
+        requests = ConditionalRequests()
+        requests.store('/camera/all', {'ETag': '"v1"', 'Last-Modified': 'Wed, 30 Oct 2024 02:03:48 GMT'}, 100, [])
+
+        self.assertEqual(requests.headers_for('/camera/all'), {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Wed, 30 Oct 2024 02:03:48 GMT',
+        })
+
+    def test_does_not_store_results_without_validators(self):
+        requests = ConditionalRequests()
+        requests.store('/camera/all', {}, 100, [])
+
+        self.assertEqual(requests.headers_for('/camera/all'), {})
+
+    def test_returns_stored_result_when_not_modified(self):
+        requests = ConditionalRequests()
+        result = ['camera']
+        requests.store('/camera/all', {'ETag': '"v1"'}, 100, result)
+
+        self.assertIs(requests.not_modified('/camera/all', requests.lookup('/camera/all')), result)
+        self.assertEqual(requests.not_modified_count, 1)
+        self.assertEqual(requests.bytes_saved, 100)
+        self.assertEqual(requests.parses_saved, 1)
+
+    def test_keeps_most_recently_used_results(self):
+        requests = ConditionalRequests(max_entries=1)
+        requests.store('/a', {'ETag': '"a"'}, 1, 'a')
+        requests.store('/b', {'ETag': '"b"'}, 1, 'b')
+
+        self.assertEqual(requests.headers_for('/a'), {})
+        self.assertEqual(requests.headers_for('/b'), {'If-None-Match': '"b"'})
+
+    def test_returns_result_evicted_while_request_was_in_flight(self):
+        requests = ConditionalRequests(max_entries=1)
+        requests.store('/a', {'ETag': '"a"'}, 1, 'a')
+        stored = requests.lookup('/a')
+        requests.store('/b', {'ETag': '"b"'}, 1, 'b')
+
+        self.assertEqual(requests.not_modified('/a', stored), 'a')
+        self.assertEqual(requests.headers_for('/a'), {'If-None-Match': '"a"'})
+        self.assertEqual(requests.headers_for('/b'), {})
@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime, timedelta
+
+from spypointapi import Camera, FleetSnapshot
+from spypointapi.fleet_snapshot import numpy
+
+
+class TestFleetSnapshot(unittest.TestCase):
+    use_numpy = False
+    now = datetime.now().astimezone()
+
+    def setUp(self):
+        self.snapshot = FleetSnapshot.from_cameras([
+            self.camera('1', battery=10, memory=20, model='FLEX', last_update=timedelta(hours=30),
+                        photo_count=50, photo_limit=100),
+            self.camera('2', battery=15, memory=40, model='LINK', last_update=timedelta(hours=1)),
+            self.camera('3', battery=90, memory=60, model='FLEX', last_update=timedelta(hours=48),
+                        photo_count=100, photo_limit=100),
+            self.camera('4', battery=None, memory=80, model=None, last_update=timedelta(hours=2)),
+        ], use_numpy=self.use_numpy)
+
+    def test_filters_on_numeric_and_time_columns(self):
+        mask = self.snapshot.less_than('battery', 20) & self.snapshot.offline_for(timedelta(hours=24), self.now)
+
+        self.assertEqual(self.snapshot.select_ids(mask), ['1'])
+        self.assertEqual(self.snapshot.count(mask), 1)
+
+    def test_combines_masks(self):
+        low_battery = self.snapshot.less_than('battery', 20)
+
+        self.assertEqual(self.snapshot.select_ids(~low_battery), ['3', '4'])
+        self.assertEqual(self.snapshot.select_ids(low_battery | self.snapshot.is_missing('battery')), ['1', '2', '4'])
+
+    def test_filters_on_dictionary_encoded_columns(self):
+        self.assertEqual(self.snapshot.select_ids(self.snapshot.equals('model', 'FLEX')), ['1', '3'])
+        self.assertEqual(self.snapshot.select_ids(self.snapshot.equals('model', 'unknown')), [])
+        self.assertEqual(self.snapshot.select_ids(self.snapshot.is_missing('model')), ['4'])
+        self.assertEqual(self.snapshot.categories('model'), ['FLEX', 'LINK'])
+
+    def test_aggregates_ignoring_missing_values(self):
+        self.assertEqual(self.snapshot.min('battery'), 10)
+        self.assertEqual(self.snapshot.max('battery'), 90)
+        self.assertAlmostEqual(self.snapshot.mean('battery'), 115 / 3)
+        self.assertEqual(self.snapshot.min('battery', self.snapshot.equals('model', 'LINK')), 15)
+        self.assertIsNone(self.snapshot.min('battery', self.snapshot.is_missing('battery')))
+
+    def test_computes_percentiles(self):
+        self.assertEqual(self.snapshot.percentile('memory', 50), 50)
+        self.assertEqual(self.snapshot.percentile('memory', 100), 80)
+        self.assertAlmostEqual(self.snapshot.percentile('memory', 95), 77)
+
+    def test_computes_photo_usage(self):
+        self.assertEqual(self.snapshot.select_ids(self.snapshot.greater_than('photo_usage', 0.9)), ['3'])
+        self.assertEqual(self.snapshot.mean('photo_usage'), 0.75)
+
+    def camera(self, camera_id, battery, memory, model, last_update, photo_count=None, photo_limit=None):
+        return Camera(id=camera_id, name="name", model=model, modem_firmware="", camera_firmware="",
+                      last_update_time=self.now - last_update, battery=battery, memory=memory,
+                      photo_count=photo_count, photo_limit=photo_limit)
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestFleetSnapshotWithNumpy(TestFleetSnapshot):
+    use_numpy = True
@@ -0,0 +1,73 @@
+import unittest
+from datetime import timedelta
+
+from spypointapi import Instrumentation, LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_estimates_percentiles_from_buckets(self):
+        histogram = LatencyHistogram(bounds_ms=(10, 100, 1000))
+        for milliseconds in [5] * 90 + [50] * 9 + [700]:
+            histogram.observe(timedelta(milliseconds=milliseconds))
+
+        self.assertEqual(histogram.counts, [90, 9, 1, 0])
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.percentile(50), timedelta(milliseconds=10))
+        self.assertEqual(histogram.percentile(95), timedelta(milliseconds=100))
+        self.assertEqual(histogram.percentile(100), timedelta(milliseconds=700))
+
+    def test_counts_latencies_above_last_bound(self):
+        histogram = LatencyHistogram(bounds_ms=(10,))
+        histogram.observe(timedelta(seconds=2))
+
+        self.assertEqual(histogram.counts, [0, 1])
+        self.assertEqual(histogram.percentile(99), timedelta(seconds=2))
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 100.0
+        self.events = []
+        self.instrumentation = Instrumentation(on_request_start=lambda event: self.events.append(('start', event)),
+                                               on_request_end=lambda event: self.events.append(('end', event)),
+                                               clock=lambda: self.now)
+
+    def test_records_requests_per_endpoint(self):
+        with self.instrumentation.request('GET', '/shared-cameras/1') as event:
+            event.status = 200
+            event.bytes = 10
+            self.now += 0.25
+
+        stats = self.instrumentation.stats('/shared-cameras/{id}')
+        self.assertEqual(stats.requests, 1)
+        self.assertEqual(stats.bytes, 10)
+        self.assertEqual(stats.statuses, {200: 1})
+        self.assertEqual(stats.latency.max, timedelta(milliseconds=250))
+        self.assertEqual([(name, hooked.url) for name, hooked in self.events],
+                         [('start', '/shared-cameras/1'), ('end', '/shared-cameras/1')])
+        self.assertEqual(event.latency, timedelta(milliseconds=250))
+
+    def test_records_errors(self):
+        with self.assertRaises(ValueError), self.instrumentation.request('GET', '/camera/all'):
+            raise ValueError()
+
+        self.assertEqual(self.instrumentation.stats('/camera/all').errors, 1)
+        self.assertIsInstance(self.events[-1][1].error, ValueError)
+
+    def test_ignores_failing_hooks(self):
+        instrumentation = Instrumentation(on_request_end=lambda event: 1 / 0)
+
+        with instrumentation.request('GET', '/camera/all'):
+            pass
+
+        self.assertEqual(instrumentation.stats('/camera/all').requests, 1)
+
+    def test_caps_logged_bodies(self):
+        instrumentation = Instrumentation(log_bodies=True, max_logged_body=4)
+
+        self.assertEqual(instrumentation.log_body(b'[1]'), '[1]')
+        self.assertEqual(instrumentation.log_body(b'[1, 2, 3]'), '[1, ... (9 bytes)')
+        self.assertEqual(instrumentation.log_body(None), 'None')
@@ -0,0 +1,20 @@
+import unittest
+
+from spypointapi import json_decoder
+from spypointapi.json_decoder import default_json_decoder, stdlib_json_decoder
+
+
+class TestJsonDecoder(unittest.TestCase):
+
+    def test_stdlib_decoder_reads_bytes(self):
+        self.assertEqual(stdlib_json_decoder('[{"name": "caméra"}]'.encode()), [{'name': 'caméra'}])
+
+    def test_default_decoder_prefers_orjson_when_installed(self):
+        expected = json_decoder.orjson.loads if json_decoder.orjson is not None else stdlib_json_decoder
+
+        self.assertIs(default_json_decoder(), expected)
+
+    def test_decoders_agree(self):
+        body = b'{"id": "1", "status": {"batteries": [0, 90, 0], "signal": null, "temperature": 21.5}}'
+
+        self.assertEqual(default_json_decoder()(body), stdlib_json_decoder(body))
@@ -0,0 +1,52 @@
+import json
+import unittest
+
+from spypointapi.json_stream import JsonArrayStream
+
+
+class TestJsonArrayStream(unittest.TestCase):
+
+    def test_yields_elements_whatever_the_chunk_boundaries(self):
+        elements = [{'id': '1', 'name': 'caméra "1"', 'batteries': [0, 90]}, 12, 'text', None, [], {}]
+        body = json.dumps(elements, indent=1).encode()
+
+        for size in range(1, 20):
+            stream = JsonArrayStream()
+            parsed = []
+            for start in range(0, len(body), size):
+                parsed.extend(stream.feed(body[start:start + size]))
+            parsed.extend(stream.close())
+
+            self.assertEqual(parsed, elements)
+
+    def test_yields_each_element_once_its_delimiter_arrived(self):
+        stream = JsonArrayStream()
+
+        self.assertEqual(stream.feed(b'[{"id": "1"}'), [])
+        self.assertEqual(stream.feed(b', {"id": "2"}, 12'), [{'id': '1'}, {'id': '2'}])
+        self.assertEqual(stream.feed(b'3]'), [123])
+        self.assertEqual(stream.close(), [])
+
+    def test_reads_empty_array(self):
+        stream = JsonArrayStream()
+
+        self.assertEqual(stream.feed(b' [ ] '), [])
+        self.assertEqual(stream.close(), [])
+
+    def test_reads_empty_array_one_byte_at_a_time(self):
+        for body in [b'[]', b'[\n]', b' [ \r\n ] ']:
+            with self.subTest(body=body):
+                stream = JsonArrayStream()
+                parsed = []
+                for start in range(len(body)):
+                    parsed.extend(stream.feed(body[start:start + 1]))
+                parsed.extend(stream.close())
+
+                self.assertEqual(parsed, [])
+
+    def test_raises_on_invalid_documents(self):
+        for body in [b'{"id": "1"}', b'[1 2]', b'[1,]', b'[,1]', b'[1', b'[1] 2', b'[] 2', b'']:
+            with self.subTest(body=body), self.assertRaises(json.JSONDecodeError):
+                stream = JsonArrayStream()
+                stream.feed(body)
+                stream.close()
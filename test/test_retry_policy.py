@@ -0,0 +1,61 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http import HTTPStatus
+
+from aiohttp import ClientConnectionError
+
+from spypointapi import RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retries_transient_statuses_until_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry(1, HTTPStatus.SERVICE_UNAVAILABLE))
+        self.assertTrue(policy.should_retry(2, HTTPStatus.TOO_MANY_REQUESTS))
+        self.assertFalse(policy.should_retry(3, HTTPStatus.SERVICE_UNAVAILABLE))
+
+    def test_does_not_retry_other_statuses(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertFalse(policy.should_retry(1, HTTPStatus.OK))
+        self.assertFalse(policy.should_retry(1, HTTPStatus.NOT_FOUND))
+
+    def test_retries_connection_errors(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry(1, error=ClientConnectionError()))
+        self.assertTrue(policy.should_retry(1, error=TimeoutError()))
+        self.assertFalse(policy.should_retry(1, error=ValueError()))
+
+    def test_does_not_retry_by_default(self):
+        self.assertFalse(RetryPolicy().should_retry(1, HTTPStatus.SERVICE_UNAVAILABLE))
+
+    def test_backs_off_exponentially_with_jitter(self):
+        policy = RetryPolicy(base_delay=timedelta(seconds=1), max_delay=timedelta(seconds=5), jitter=lambda: 0.5)
+
+        self.assertEqual(policy.delay(1), timedelta(seconds=0.5))
+        self.assertEqual(policy.delay(2), timedelta(seconds=1))
+        self.assertEqual(policy.delay(3), timedelta(seconds=2))
+        self.assertEqual(policy.delay(4), timedelta(seconds=2.5))
+
+    def test_honors_retry_after_seconds(self):
+        policy = RetryPolicy(max_delay=timedelta(seconds=30))
+
+        self.assertEqual(policy.delay(1, '7'), timedelta(seconds=7))
+        self.assertEqual(policy.delay(1, '120'), timedelta(seconds=30))
+
+    def test_honors_retry_after_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+        delay = RetryPolicy().delay(1, format_datetime(retry_at, usegmt=True))
+
+        self.assertGreater(delay, timedelta(seconds=8))
+        self.assertLessEqual(delay, timedelta(seconds=10))
+
+    def test_ignores_invalid_retry_after(self):
+        policy = RetryPolicy(base_delay=timedelta(seconds=1), jitter=lambda: 1)
+
+        self.assertEqual(policy.delay(1, 'soon'), timedelta(seconds=1))
@@ -0,0 +1,91 @@
+import asyncio
+import unittest
+
+from spypointapi.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        results = await asyncio.gather(*[single_flight.run('key', call) for _ in range(3)])
+
+        self.assertEqual(results, ['result'] * 3)
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(single_flight.in_flight('key'))
+
+    async def test_runs_again_once_previous_call_completed(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+
+        await single_flight.run('key', call)
+        await single_flight.run('key', call)
+
+        self.assertEqual(len(calls), 2)
+
+    async def test_shares_error_with_all_callers(self):
+        single_flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ValueError()
+
+        results = await asyncio.gather(*[single_flight.run('key', call) for _ in range(2)], return_exceptions=True)
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIs(results[0], results[1])
+
+    async def test_join_keeps_call_while_a_caller_still_waits(self):
+        single_flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        first = asyncio.ensure_future(single_flight.join('key', call))
+        second = asyncio.ensure_future(single_flight.join('key', call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, 'result')
+        self.assertTrue(first.cancelled())
+
+    async def test_join_cancels_call_once_every_caller_gave_up(self):
+        single_flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def call():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(single_flight.join('key', call), 0.01)
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        self.assertFalse(single_flight.in_flight('key'))
+
+    async def test_join_does_not_cancel_background_call(self):
+        single_flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        task = single_flight.start('key', call)
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(single_flight.join('key', call), 0.001)
+
+        self.assertEqual(await task, 'result')
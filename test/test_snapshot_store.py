@@ -0,0 +1,56 @@
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from spypointapi import Camera, Coordinates, SqliteSnapshotStore
+from spypointapi.cameras.camera import TransmitTime
+
+
+class TestSqliteSnapshotStore(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'snapshots.db'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def test_loads_saved_cameras(self):
+        camera = Camera(id='1', name='camera', model='FLEX', modem_firmware='1.0', camera_firmware='2.0',
+                        last_update_time=datetime(2024, 10, 30, 2, 3, 48, tzinfo=timezone.utc),
+                        battery=90, notifications=['low_battery'], coordinates=Coordinates(45.1, -70.1),
+                        transmit_time=TransmitTime(6, 0), activation_date=datetime(2024, 9, 30, tzinfo=timezone.utc))
+        before = datetime.now(timezone.utc)
+
+        await SqliteSnapshotStore(self.path).save('user', '/camera/all', [camera])
+        snapshot = await SqliteSnapshotStore(self.path).load('user', '/camera/all')
+
+        self.assertEqual(snapshot.cameras, [camera])
+        self.assertGreaterEqual(snapshot.stored_at, before.replace(microsecond=0))
+
+    async def test_keeps_one_snapshot_per_account_and_source(self):
+        store = SqliteSnapshotStore(self.path)
+
+        await store.save('user', '/camera/all', [self.camera('1')])
+        await store.save('user', '/camera/all', [self.camera('2')])
+        await store.save('other', '/camera/all', [self.camera('3')])
+
+        self.assertEqual([c.id for c in (await store.load('user', '/camera/all')).cameras], ['2'])
+        self.assertEqual([c.id for c in (await store.load('other', '/camera/all')).cameras], ['3'])
+        self.assertIsNone(await store.load('user', '/shared-cameras/all'))
+
+    async def test_ignores_unreadable_snapshot(self):
+        store = SqliteSnapshotStore(self.path)
+        await store.save('user', '/camera/all', [])
+        with sqlite3.connect(self.path) as connection:
+            connection.execute("UPDATE snapshots SET cameras = '[{\"unknown\": 1}]'")
+        connection.close()
+
+        self.assertIsNone(await store.load('user', '/camera/all'))
+
+    @staticmethod
+    def camera(camera_id):
+        return Camera(id=camera_id, name='camera', model='FLEX', modem_firmware='', camera_firmware='',
+                      last_update_time=datetime.now(timezone.utc))
@@ -1,11 +1,18 @@
+import asyncio
+import json
+import tempfile
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from http import HTTPStatus
+from pathlib import Path
 
 import aiohttp
 import jwt
 
-from spypointapi import SpypointApi
+from spypointapi import (AdaptiveLimiter, CameraAdded, CircuitBreakers, CircuitState, ConditionalRequests,
+                         Instrumentation, LazyCameraApiResponse, RefreshSchedule, RetryPolicy, SpypointApi,
+                         SpypointApiCircuitOpenError, SqliteSnapshotStore, TtlCache)
+from spypointapi.token_store import FileTokenStore, MemoryTokenStore, StoredToken
 from spypointapi.cameras.camera_api_response import CameraApiResponse
 from spypointapi.spypoint_api import SpypointApiInvalidCredentialsError, SpypointApiError
 from .spypoint_server_for_test import SpypointServerForTest
@@ -32,6 +39,112 @@ class TestSpypointApi(unittest.IsolatedAsyncioTestCase):
                 self.assertEqual(api.headers.get('Authorization'), f'Bearer {token}')
                 self.assertEqual(api.expires_at, datetime.fromtimestamp(1627417600))
 
+    async def test_concurrent_authentications_share_one_login(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                await asyncio.gather(*[api.async_authenticate() for _ in range(5)])
+
+                server.assert_called_n_times_with(1, url='/user/login',
+                                                  method='POST',
+                                                  headers={'Content-Type': 'application/json'},
+                                                  json={'username': self.username, 'password': self.password})
+
+    async def test_refreshes_token_in_background_before_expiry(self):
+        with SpypointServerForTest() as server:
+            expires_at = int((datetime.now() + timedelta(minutes=1)).timestamp())
+            server.prepare_login_response({'token': jwt.encode({'exp': expires_at}, 'secret')})
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, refresh_before_expiry=timedelta(minutes=5))
+                await api.async_authenticate()
+                await api.async_authenticate()
+                await asyncio.sleep(0.01)
+
+                server.assert_called_n_times(2, url='/user/login', method='POST')
+                self.assertEqual(api.expires_at, datetime.fromtimestamp(expires_at))
+
+    async def test_processes_sharing_a_token_store_log_in_once(self):
+        with tempfile.TemporaryDirectory() as directory, SpypointServerForTest() as server:
+            expires_at = int((datetime.now() + timedelta(hours=1)).timestamp())
+            token = server.prepare_login_response({'token': jwt.encode({'exp': expires_at}, 'secret')})
+
+            async with aiohttp.ClientSession() as session:
+                apis = [SpypointApi(self.username, self.password, session,
+                                    token_store=FileTokenStore(Path(directory) / 'tokens.json'))
+                        for _ in range(3)]
+                await asyncio.gather(*(api.async_authenticate() for api in apis))
+
+                server.assert_called_n_times(1, url='/user/login', method='POST')
+                self.assertEqual({api.headers['Authorization'] for api in apis}, {f'Bearer {token}'})
+
+    async def test_refreshes_shared_token_once_near_expiry(self):
+        with SpypointServerForTest() as server:
+            expires_at = int((datetime.now() + timedelta(hours=1)).timestamp())
+            server.prepare_login_response({'token': jwt.encode({'exp': expires_at}, 'secret')})
+            store = MemoryTokenStore()
+            await store.save(self.username, StoredToken('old', datetime.now() + timedelta(minutes=1)))
+
+            async with aiohttp.ClientSession() as session:
+                apis = [SpypointApi(self.username, self.password, session, token_store=store,
+                                    refresh_before_expiry=timedelta(minutes=5)) for _ in range(3)]
+                await asyncio.gather(*(api.async_authenticate() for api in apis))
+
+                server.assert_called_n_times(1, url='/user/login', method='POST')
+                self.assertEqual({api.expires_at for api in apis}, {datetime.fromtimestamp(expires_at)})
+
+    async def test_does_not_adopt_stored_token_after_it_was_rejected(self):
+        with SpypointServerForTest() as server:
+            token = server.prepare_login_response()
+            server.prepare_cameras_response(status=HTTPStatus.UNAUTHORIZED, repeat=False)
+            server.prepare_cameras_response([])
+            store = MemoryTokenStore()
+            await store.save(self.username, StoredToken('revoked', datetime.now() + timedelta(hours=1)))
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, token_store=store)
+                await api.async_get_own_cameras()
+
+                server.assert_called_n_times(1, url='/user/login', method='POST')
+                self.assertEqual((await store.load(self.username)).token, token)
+
+    async def test_owns_a_tuned_session_when_none_is_given(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+
+            async with SpypointApi(self.username, self.password,
+                                   shared_cameras_limiter=AdaptiveLimiter(max_limit=20)) as api:
+                cameras = await api.async_get_own_cameras()
+                session = api.session
+
+                self.assertEqual([camera.id for camera in cameras], ['1'])
+                self.assertEqual(session.connector.limit_per_host, 21)
+                self.assertFalse(session.closed)
+
+            self.assertTrue(session.closed)
+
+    async def test_does_not_close_a_given_session(self):
+        async with aiohttp.ClientSession() as session:
+            async with SpypointApi(self.username, self.password, session) as api:
+                self.assertIs(api.session, session)
+
+            self.assertFalse(session.closed)
+
+    async def test_warm_up_logs_in_and_opens_connections(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_warm_up_response()
+
+            async with SpypointApi(self.username, self.password) as api:
+                await api.warm_up(connections=4)
+
+                server.assert_called_n_times(1, url='/user/login', method='POST')
+                server.assert_called_n_times(3, url='', method='HEAD')
+                self.assertIn('Authorization', api.headers)
+
     async def test_authenticate_invalid_credentials_error(self):
         with SpypointServerForTest() as server:
             server.prepare_login_response(status=HTTPStatus.UNAUTHORIZED)
@@ -92,6 +205,32 @@ class TestSpypointApi(unittest.IsolatedAsyncioTestCase):
                 expected_cameras = CameraApiResponse.from_json(cameras_response)
                 self.assertEqual(cameras, expected_cameras)
 
+    async def test_iterates_own_cameras_from_streamed_body(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1'), self.camera_response('2')])
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                with self.assertLogs('spypointapi', level='DEBUG'):
+                    cameras = [camera async for camera in api.async_iter_own_cameras()]
+
+                self.assertEqual([camera.id for camera in cameras], ['1', '2'])
+                self.assertEqual(cameras, await api.async_get_own_cameras())
+
+    async def test_holds_request_slot_until_body_is_read(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1'), self.camera_response('2')])
+
+            async with aiohttp.ClientSession() as session:
+                request_slot = asyncio.Semaphore(1)
+                api = SpypointApi(self.username, self.password, session, request_semaphores=(request_slot,))
+                held_while_reading = [request_slot.locked() async for _ in api.async_iter_own_cameras()]
+
+                self.assertEqual(held_while_reading, [True, True])
+                self.assertFalse(request_slot.locked())
+
     async def test_get_shared_cameras(self):
         with SpypointServerForTest() as server:
             token = server.prepare_login_response()
@@ -131,6 +270,7 @@ class TestSpypointApi(unittest.IsolatedAsyncioTestCase):
         with SpypointServerForTest() as server:
             server.prepare_login_response()
             server.prepare_cameras_response(status=HTTPStatus.UNAUTHORIZED)
+            server.prepare_shared_cameras_response()
 
             async with aiohttp.ClientSession() as session:
                 api = SpypointApi(self.username, self.password, session)
@@ -140,3 +280,511 @@ class TestSpypointApi(unittest.IsolatedAsyncioTestCase):
 
                 self.assertLess(api.expires_at, datetime.now())
                 self.assertIsNone(api.headers.get('Authorization'))
+
+    async def test_get_cameras_returns_own_and_shared_cameras(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+            server.prepare_shared_cameras_response([{"sharedCameras": [{"cameraId": "2"}]}])
+            server.prepare_shared_camera_response('2', self.camera_response())
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                cameras = await api.async_get_cameras()
+
+                self.assertEqual([camera.id for camera in cameras], ['1', '2'])
+
+    async def test_get_cameras_with_errors_returns_partial_results(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+            server.prepare_shared_cameras_response([{"sharedCameras": [{"cameraId": "2"}, {"cameraId": "3"}]}])
+            server.prepare_shared_camera_response('2', self.camera_response())
+            server.prepare_shared_camera_response('3', status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                result = await api.async_get_cameras_with_errors()
+
+                self.assertEqual([camera.id for camera in result.cameras], ['1', '2'])
+                self.assertFalse(result.is_complete)
+                self.assertEqual([error.source for error in result.errors], ['/shared-cameras/3'])
+                self.assertEqual(result.errors[0].error.status, HTTPStatus.SERVICE_UNAVAILABLE)
+
+    async def test_get_cameras_with_errors_reports_failed_camera_list(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
+            server.prepare_shared_cameras_response([{"sharedCameras": [{"cameraId": "2"}]}])
+            server.prepare_shared_camera_response('2', self.camera_response())
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                result = await api.async_get_cameras_with_errors()
+
+                self.assertEqual([camera.id for camera in result.cameras], ['2'])
+                self.assertEqual([error.source for error in result.errors], ['/camera/all'])
+
+    async def test_shared_cameras_limiter_backs_off_when_throttled(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_shared_cameras_response([{"sharedCameras": [{"cameraId": "1"}]}])
+            server.prepare_shared_camera_response('1', status=HTTPStatus.TOO_MANY_REQUESTS)
+
+            async with aiohttp.ClientSession() as session:
+                limiter = AdaptiveLimiter(limit=4)
+                api = SpypointApi(self.username, self.password, session, shared_cameras_limiter=limiter)
+
+                with self.assertRaises(SpypointApiError):
+                    await api.async_get_shared_cameras()
+
+                self.assertEqual(limiter.limit, 2)
+
+    async def test_shared_cameras_limiter_backs_off_on_throttles_recovered_by_retries(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_shared_cameras_response([{"sharedCameras": [{"cameraId": "1"}, {"cameraId": "2"}]}])
+            for camera_id in ['1', '2']:
+                server.prepare_shared_camera_response(camera_id, status=HTTPStatus.TOO_MANY_REQUESTS, repeat=False)
+                server.prepare_shared_camera_response(camera_id, self.camera_response())
+
+            async with aiohttp.ClientSession() as session:
+                limiter = AdaptiveLimiter(limit=4)
+                api = SpypointApi(self.username, self.password, session, shared_cameras_limiter=limiter,
+                                  retry_policy=RetryPolicy(max_attempts=3, jitter=lambda: 0))
+
+                cameras = await api.async_get_shared_cameras()
+
+                self.assertEqual(len(cameras), 2)
+                self.assertEqual(limiter.throttled_count, 2)
+                self.assertLess(limiter.limit, 4)
+                self.assertEqual(limiter.in_flight, 0)
+
+    async def test_coalesces_concurrent_identical_reads(self):
+        with SpypointServerForTest() as server:
+            expires_at = int((datetime.now() + timedelta(hours=1)).timestamp())
+            server.prepare_login_response({'token': jwt.encode({'exp': expires_at}, 'secret')})
+            server.prepare_cameras_response([self.camera_response('1')])
+            server.prepare_shared_cameras_response([{'sharedCameras': [{'cameraId': '2'}]}])
+            server.prepare_shared_camera_response('2', self.camera_response())
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                results = await asyncio.gather(api.async_get_cameras(), api.async_get_cameras(),
+                                               api.async_get_own_cameras(), api.async_get_shared_cameras())
+
+                self.assertEqual([[camera.id for camera in cameras] for cameras in results],
+                                 [['1', '2'], ['1', '2'], ['1'], ['2']])
+                self.assertIsNot(results[0], results[1])
+                self.assertEqual(api.coalesced_calls, 3)
+                server.assert_called_n_times(1, url='/camera/all', method='GET')
+                server.assert_called_n_times(1, url='/shared-cameras/all', method='GET')
+                server.assert_called_n_times(1, url='/shared-cameras/2', method='GET')
+
+                await api.async_get_own_cameras()
+
+                server.assert_called_n_times(2, url='/camera/all', method='GET')
+                self.assertEqual(api.coalesced_calls, 3)
+
+    async def test_stops_reading_once_its_only_caller_gave_up(self):
+        with SpypointServerForTest() as server:
+            expires_at = int((datetime.now() + timedelta(hours=1)).timestamp())
+            server.prepare_login_response({'token': jwt.encode({'exp': expires_at}, 'secret')})
+
+            async def slow_response(url, **kwargs):
+                await asyncio.sleep(0.05)
+
+            server.server.get(server.url('/camera/all'), payload=[], callback=slow_response, repeat=True)
+            server.server.get(server.url('/shared-cameras/all'), payload=[{'sharedCameras': [{'cameraId': '1'}]}],
+                              callback=slow_response, repeat=True)
+            server.prepare_shared_camera_response('1', self.camera_response())
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                await api.async_authenticate()
+                with self.assertRaises(asyncio.TimeoutError):
+                    await asyncio.wait_for(api.async_get_cameras(), 0.01)
+                await asyncio.sleep(0.1)
+
+                for key in ('cameras', '/camera/all', '/shared-cameras/all'):
+                    self.assertFalse(api._reads.in_flight(key))
+                server.assert_called_n_times(0, url='/shared-cameras/1', method='GET')
+
+    async def test_shares_errors_with_coalesced_reads(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                results = await asyncio.gather(api.async_get_own_cameras(), api.async_get_own_cameras(),
+                                               return_exceptions=True)
+
+                self.assertTrue(all(isinstance(result, SpypointApiError) for result in results))
+                server.assert_called_n_times(1, url='/camera/all', method='GET')
+
+    async def test_serves_cameras_from_cache(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, cache=TtlCache())
+                first = await api.async_get_own_cameras()
+                second = await api.async_get_own_cameras()
+                api.invalidate_cache('/camera/all')
+                await api.async_get_own_cameras()
+
+                self.assertEqual(first, second)
+                self.assertEqual((api.cache.hits, api.cache.misses), (1, 2))
+                server.assert_called_n_times(2, url='/camera/all', method='GET')
+
+    async def test_refreshes_shared_cameras_incrementally(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_shared_cameras_response([{"sharedCameras": [{"cameraId": "1"}]}], repeat=False)
+            server.prepare_shared_cameras_response([{"sharedCameras": [{"cameraId": "1"}, {"cameraId": "2"}]}])
+            server.prepare_shared_camera_response('1', self.camera_response())
+            server.prepare_shared_camera_response('2', self.camera_response())
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session,
+                                  shared_cameras_schedule=RefreshSchedule(min_interval=timedelta(minutes=10)))
+                await api.async_get_shared_cameras()
+                cameras = await api.async_get_shared_cameras()
+
+                self.assertEqual([camera.id for camera in cameras], ['1', '2'])
+                server.assert_called_n_times(1, url='/shared-cameras/1', method='GET')
+                server.assert_called_n_times(1, url='/shared-cameras/2', method='GET')
+
+    async def test_serves_snapshot_on_startup_and_refreshes_it_in_background(self):
+        with tempfile.TemporaryDirectory() as directory, SpypointServerForTest() as server:
+            expires_at = int((datetime.now() + timedelta(hours=1)).timestamp())
+            responses = asyncio.Event()
+
+            async def held_response(url, **kwargs):
+                await responses.wait()
+
+            server.server.post(server.url('/user/login'), payload={'token': jwt.encode({'exp': expires_at}, 'secret')},
+                               callback=held_response, repeat=True)
+            server.server.get(server.url('/camera/all'), payload=[self.camera_response('1')], callback=held_response)
+            server.server.get(server.url('/camera/all'), payload=[self.camera_response('2')], callback=held_response,
+                              repeat=True)
+            store = SqliteSnapshotStore(Path(directory) / 'snapshots.db')
+
+            async with aiohttp.ClientSession() as session:
+                responses.set()
+                first_run = SpypointApi(self.username, self.password, session, snapshot_store=store)
+                self.assertEqual([camera.id for camera in await first_run.async_get_own_cameras()], ['1'])
+                await first_run.close()
+
+                # the snapshot is served while no login or camera list response has arrived yet
+                responses.clear()
+                restarted = SpypointApi(self.username, self.password, session, snapshot_store=store)
+                cameras = await asyncio.wait_for(restarted.async_get_own_cameras(), 1)
+                self.assertEqual([camera.id for camera in cameras], ['1'])
+
+                responses.set()
+                await restarted._single_flight.wait()
+                await restarted.close()
+
+                self.assertEqual([camera.id for camera in (await store.load(self.username, '/camera/all')).cameras],
+                                 ['2'])
+                self.assertEqual([camera.id for camera in await restarted.async_get_own_cameras()], ['2'])
+                server.assert_called_n_times(2, url='/user/login', method='POST')
+
+    async def test_skips_snapshot_of_unchanged_cameras_and_spaces_out_writes(self):
+        with tempfile.TemporaryDirectory() as directory, SpypointServerForTest() as server:
+            expires_at = int((datetime.now() + timedelta(hours=1)).timestamp())
+            server.prepare_login_response({'token': jwt.encode({'exp': expires_at}, 'secret')})
+            server.prepare_cameras_response([self.camera_response('1')], headers={'ETag': '"v1"'}, repeat=False)
+            server.prepare_cameras_response(status=HTTPStatus.NOT_MODIFIED, repeat=False)
+            server.prepare_cameras_response([self.camera_response('2')], repeat=False)
+            store = SqliteSnapshotStore(Path(directory) / 'snapshots.db')
+            saves = []
+            save = store.save
+
+            async def counting_save(account, source, cameras):
+                saves.append([camera.id for camera in cameras])
+                await save(account, source, cameras)
+
+            store.save = counting_save
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, snapshot_store=store,
+                                  snapshot_interval=timedelta(0))
+                for _ in range(3):
+                    await api.async_get_own_cameras()
+                    await api.close()
+                self.assertEqual(saves, [['1'], ['2']])
+
+                server.prepare_cameras_response([self.camera_response('3')], repeat=False)
+                api.snapshot_interval = timedelta(hours=1)
+                await api.async_get_own_cameras()
+                await api.close()
+                self.assertEqual(saves, [['1'], ['2']])
+
+    async def test_ignores_snapshot_store_that_fails(self):
+        with tempfile.TemporaryDirectory() as directory, SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+            unopenable = SqliteSnapshotStore(directory)
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, snapshot_store=unopenable)
+                with self.assertLogs('spypointapi', level='DEBUG') as logs:
+                    cameras = await api.async_get_own_cameras()
+                    await api.close()
+
+                self.assertEqual([camera.id for camera in cameras], ['1'])
+                self.assertTrue(any('failed to load' in line for line in logs.output))
+                self.assertTrue(any('failed to save' in line for line in logs.output))
+
+    async def test_saves_snapshot_of_lazy_cameras(self):
+        with tempfile.TemporaryDirectory() as directory, SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+            store = SqliteSnapshotStore(Path(directory) / 'snapshots.db')
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, snapshot_store=store,
+                                  camera_parser=LazyCameraApiResponse)
+                cameras = await api.async_get_own_cameras()
+                await api.close()
+
+                self.assertEqual((await store.load(self.username, '/camera/all')).cameras, cameras)
+
+    async def test_reuses_parsed_camera_evicted_while_its_request_was_in_flight(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_shared_cameras_response([{'sharedCameras': [{'cameraId': '1'}, {'cameraId': '2'}]}],
+                                                   repeat=False)
+            server.prepare_shared_cameras_response(
+                [{'sharedCameras': [{'cameraId': '3'}, {'cameraId': '1'}, {'cameraId': '2'}]}])
+            for camera_id in ['1', '2']:
+                server.prepare_shared_camera_response(camera_id, self.camera_response(),
+                                                      headers={'ETag': f'"{camera_id}"'}, repeat=False)
+                server.prepare_shared_camera_response(camera_id, status=HTTPStatus.NOT_MODIFIED)
+            server.prepare_shared_camera_response('3', self.camera_response(), headers={'ETag': '"3"'})
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session,
+                                  conditional_requests=ConditionalRequests(max_entries=2))
+                await api.async_get_shared_cameras()
+                cameras = await api.async_get_shared_cameras()
+
+                self.assertEqual([camera.id for camera in cameras], ['3', '1', '2'])
+                self.assertEqual(api.conditional_requests.not_modified_count, 2)
+
+    async def test_reuses_parsed_cameras_when_not_modified(self):
+        with SpypointServerForTest() as server:
+            token = server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')], headers={'ETag': '"v1"'}, repeat=False)
+            server.prepare_cameras_response(status=HTTPStatus.NOT_MODIFIED, headers={'ETag': '"v1"'})
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                first = await api.async_get_own_cameras()
+                second = await api.async_get_own_cameras()
+
+                server.assert_called_with(
+                    url='/camera/all',
+                    method='GET',
+                    headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {token}',
+                             'If-None-Match': '"v1"'})
+                self.assertEqual(second, first)
+                self.assertEqual(api.conditional_requests.not_modified_count, 1)
+                self.assertEqual(api.conditional_requests.parses_saved, 1)
+                self.assertGreater(api.conditional_requests.bytes_saved, 0)
+
+    async def test_decodes_response_bytes_with_json_decoder(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+            decoded = []
+
+            def json_decoder(body: bytes):
+                decoded.append(body)
+                return json.loads(body)
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, json_decoder=json_decoder)
+                cameras = await api.async_get_own_cameras()
+
+                self.assertEqual([camera.id for camera in cameras], ['1'])
+                self.assertEqual(len(decoded), 2)
+                self.assertTrue(all(isinstance(body, bytes) for body in decoded))
+
+    async def test_instruments_requests_per_endpoint(self):
+        with SpypointServerForTest() as server:
+            expires_at = int((datetime.now() + timedelta(hours=1)).timestamp())
+            server.prepare_login_response({'token': jwt.encode({'exp': expires_at}, 'secret')})
+            server.prepare_cameras_response([self.camera_response('1')])
+            server.prepare_shared_cameras_response([{'sharedCameras': [{'cameraId': '2'}, {'cameraId': '3'}]}])
+            server.prepare_shared_camera_response('2', self.camera_response())
+            server.prepare_shared_camera_response('3', status=HTTPStatus.INTERNAL_SERVER_ERROR)
+            ended = []
+            instrumentation = Instrumentation(on_request_end=ended.append)
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, instrumentation=instrumentation)
+                await api.async_get_cameras_with_errors()
+
+                self.assertEqual(sorted(instrumentation.endpoints),
+                                 ['/camera/all', '/shared-cameras/all', '/shared-cameras/{id}', '/user/login'])
+                shared_camera_stats = instrumentation.stats('/shared-cameras/{id}')
+                self.assertEqual(shared_camera_stats.requests, 2)
+                self.assertEqual(shared_camera_stats.errors, 1)
+                self.assertEqual(shared_camera_stats.statuses, {200: 1, 500: 1})
+                self.assertEqual(shared_camera_stats.latency.count, 2)
+                self.assertGreater(instrumentation.stats('/camera/all').bytes, 0)
+                self.assertEqual(len(ended), 5)
+                self.assertTrue(all(event.latency is not None and event.attempts == 1 for event in ended))
+
+    async def test_logs_bodies_only_when_enabled(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                with self.assertLogs('spypointapi', level='DEBUG') as logs:
+                    await api.async_get_own_cameras()
+                self.assertNotIn(self.password, '\n'.join(logs.output))
+                self.assertNotIn('lastUpdate', '\n'.join(logs.output))
+
+                api.instrumentation = Instrumentation(log_bodies=True, max_logged_body=20)
+                api.invalidate_cache()
+                with self.assertLogs('spypointapi', level='DEBUG') as logs:
+                    await api.async_get_own_cameras()
+                self.assertIn('... (', '\n'.join(logs.output))
+
+    async def test_logs_in_again_and_replays_request_on_unauthorized(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response(status=HTTPStatus.UNAUTHORIZED, repeat=False)
+            server.prepare_cameras_response([self.camera_response('1')])
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                cameras = await api.async_get_own_cameras()
+
+                self.assertEqual([camera.id for camera in cameras], ['1'])
+                server.assert_called_n_times(2, url='/user/login', method='POST')
+                server.assert_called_n_times(2, url='/camera/all', method='GET')
+
+    async def test_retries_transient_errors_and_reports_attempts(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response(status=HTTPStatus.SERVICE_UNAVAILABLE, repeat=False,
+                                            headers={'Retry-After': '0'})
+            server.prepare_cameras_response([self.camera_response('1')])
+
+            async with aiohttp.ClientSession() as session:
+                attempts = []
+                api = SpypointApi(self.username, self.password, session,
+                                  retry_policy=RetryPolicy(max_attempts=3, on_attempt=attempts.append))
+                cameras = await api.async_get_own_cameras()
+
+                self.assertEqual([camera.id for camera in cameras], ['1'])
+                camera_attempts = [attempt for attempt in attempts if attempt.url == '/camera/all']
+                self.assertEqual([(attempt.attempt, attempt.status) for attempt in camera_attempts],
+                                 [(1, HTTPStatus.SERVICE_UNAVAILABLE), (2, HTTPStatus.OK)])
+                self.assertEqual(camera_attempts[0].retry_in, timedelta(0))
+                self.assertIsNone(camera_attempts[1].retry_in)
+
+    async def test_stops_retrying_after_max_attempts(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response(status=HTTPStatus.SERVICE_UNAVAILABLE, headers={'Retry-After': '0'})
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session, retry_policy=RetryPolicy(max_attempts=2))
+
+                with self.assertRaises(SpypointApiError):
+                    await api.async_get_own_cameras()
+
+                server.assert_called_n_times(2, url='/camera/all', method='GET')
+
+    async def test_fails_fast_while_circuit_is_open(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response(status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session,
+                                  circuit_breakers=CircuitBreakers(failure_threshold=2))
+
+                for _ in range(2):
+                    with self.assertRaises(SpypointApiError):
+                        await api.async_get_own_cameras()
+                with self.assertRaises(SpypointApiCircuitOpenError):
+                    await api.async_get_own_cameras()
+
+                server.assert_called_n_times(2, url='/camera/all', method='GET')
+                self.assertEqual(api.circuit_breakers.state('camera/all'), CircuitState.OPEN)
+
+    async def test_caller_timeouts_do_not_open_circuit(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+
+            async def slow_response(url, **kwargs):
+                await asyncio.sleep(0.05)
+
+            server.server.get(server.url('/camera/all'), payload=[], callback=slow_response, repeat=True)
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session,
+                                  circuit_breakers=CircuitBreakers(failure_threshold=2))
+
+                async def read_cameras():
+                    return [camera async for camera in api.async_iter_own_cameras()]
+
+                for _ in range(2):
+                    with self.assertRaises(asyncio.TimeoutError):
+                        await asyncio.wait_for(read_cameras(), 0.01)
+
+                self.assertEqual(api.circuit_breakers.state('camera/all'), CircuitState.CLOSED)
+                self.assertEqual(await read_cameras(), [])
+
+    async def test_watch_yields_camera_events(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response([self.camera_response('1')])
+            server.prepare_shared_cameras_response()
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                watch = api.watch()
+                event = await anext(watch)
+                await watch.aclose()
+
+                self.assertIsInstance(event, CameraAdded)
+                self.assertEqual(event.camera.id, '1')
+
+    async def test_reads_after_watch_fetch_every_shared_camera(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response()
+            server.prepare_cameras_response()
+            server.prepare_shared_cameras_response([{"sharedCameras": [{"cameraId": "1"}]}])
+            server.prepare_shared_camera_response('1', self.camera_response())
+
+            async with aiohttp.ClientSession() as session:
+                api = SpypointApi(self.username, self.password, session)
+                watch = api.watch(RefreshSchedule(min_interval=timedelta(minutes=10)))
+                await anext(watch)
+                await watch.aclose()
+                await api.async_get_shared_cameras()
+
+                self.assertIsNone(api.shared_cameras_tracker)
+                server.assert_called_n_times(2, url='/shared-cameras/1', method='GET')
+
+    @staticmethod
+    def camera_response(camera_id=None):
+        response = {
+            "config": {"name": "camera", },
+            "status": {"model": "model", "lastUpdate": "2024-10-30T02:03:48.716Z", }
+        }
+        if camera_id is not None:
+            response["id"] = camera_id
+        return response
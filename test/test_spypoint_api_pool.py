@@ -0,0 +1,127 @@
+import asyncio
+import unittest
+from datetime import timedelta
+from http import HTTPStatus
+
+import aiohttp
+import jwt
+from aioresponses import CallbackResult
+
+from spypointapi import CameraParseCache, SpypointApiInvalidCredentialsError, SpypointApiPool, TtlCache
+from .spypoint_server_for_test import SpypointServerForTest
+
+
+class TestSpypointApiPool(unittest.IsolatedAsyncioTestCase):
+
+    async def test_polls_all_accounts_and_isolates_errors(self):
+        with SpypointServerForTest() as server:
+            self.prepare_login_for(server, valid_username='good')
+            server.prepare_cameras_response([{
+                "id": "1",
+                "config": {"name": "camera", },
+                "status": {"model": "model", "lastUpdate": "2024-10-30T02:03:48.716Z", }
+            }])
+            server.prepare_shared_cameras_response()
+
+            async with aiohttp.ClientSession() as session:
+                pool = SpypointApiPool(session)
+                pool.add_account('good', 'password')
+                pool.add_account('bad', 'password')
+
+                results = {result.username: result async for result in pool.poll()}
+
+                self.assertEqual([camera.id for camera in results['good'].cameras], ['1'])
+                self.assertIsNone(results['good'].error)
+                self.assertEqual(results['bad'].cameras, [])
+                self.assertIsInstance(results['bad'].error, SpypointApiInvalidCredentialsError)
+
+    async def test_limits_requests_in_flight(self):
+        with SpypointServerForTest() as server:
+            in_flight = 0
+            max_in_flight = 0
+
+            async def slow_login(url, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return CallbackResult(status=HTTPStatus.UNAUTHORIZED)
+
+            server.server.post(f'{server.base_url}/user/login', callback=slow_login, repeat=True)
+
+            async with aiohttp.ClientSession() as session:
+                pool = SpypointApiPool(session, max_in_flight=2)
+                for index in range(6):
+                    pool.add_account(f'user{index}', 'password')
+
+                results = [result async for result in pool.poll()]
+
+                self.assertEqual(len(results), 6)
+                self.assertEqual(max_in_flight, 2)
+
+    async def test_spreads_polls_over_interval(self):
+        with SpypointServerForTest() as server:
+            server.prepare_login_response(status=HTTPStatus.UNAUTHORIZED)
+
+            async with aiohttp.ClientSession() as session:
+                pool = SpypointApiPool(session)
+                pool.add_account('first', 'password')
+                pool.add_account('second', 'password')
+
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+                finished = {}
+                async for result in pool.poll(spread=timedelta(milliseconds=100)):
+                    finished[result.username] = loop.time() - started
+
+                self.assertLess(finished['first'], 0.05)
+                self.assertGreaterEqual(finished['second'], 0.05)
+
+    async def test_keeps_cached_cameras_per_account(self):
+        with SpypointServerForTest() as server:
+            def login(url, json, **kwargs):
+                token = jwt.encode({'exp': 4102444800, 'sub': json['username']}, 'secret')
+                return CallbackResult(payload={'token': token})
+
+            def cameras(url, headers, **kwargs):
+                token = headers['Authorization'].removeprefix('Bearer ')
+                username = jwt.decode(token, options={'verify_signature': False})['sub']
+                return CallbackResult(payload=[{
+                    "id": f"{username}-cam",
+                    "config": {"name": "camera", },
+                    "status": {"model": "model", "lastUpdate": "2024-10-30T02:03:48.716Z", }
+                }])
+
+            server.server.post(f'{server.base_url}/user/login', callback=login, repeat=True)
+            server.server.get(f'{server.base_url}/camera/all', callback=cameras, repeat=True)
+            server.prepare_shared_cameras_response()
+
+            async with aiohttp.ClientSession() as session:
+                pool = SpypointApiPool(session, account_options=lambda: {'cache': TtlCache()})
+                pool.add_account('alice', 'password')
+                pool.add_account('bob', 'password')
+
+                first_poll = {result.username: result async for result in pool.poll()}
+                second_poll = {result.username: result async for result in pool.poll()}
+
+                for results in (first_poll, second_poll):
+                    self.assertEqual([camera.id for camera in results['alice'].cameras], ['alice-cam'])
+                    self.assertEqual([camera.id for camera in results['bob'].cameras], ['bob-cam'])
+                self.assertIsNot(pool.accounts['alice'].cache, pool.accounts['bob'].cache)
+
+    async def test_rejects_state_shared_between_accounts(self):
+        async with aiohttp.ClientSession() as session:
+            with self.assertRaises(ValueError):
+                SpypointApiPool(session, cache=TtlCache())
+            with self.assertRaises(ValueError):
+                SpypointApiPool(session, camera_parser=CameraParseCache())
+
+    @staticmethod
+    def prepare_login_for(server: SpypointServerForTest, valid_username: str):
+        def login(url, json, **kwargs):
+            if json['username'] != valid_username:
+                return CallbackResult(status=HTTPStatus.UNAUTHORIZED)
+            return CallbackResult(payload={'token': jwt.encode({'exp': 1627417600}, 'secret')})
+
+        server.server.post(f'{server.base_url}/user/login', callback=login, repeat=True)
@@ -0,0 +1,75 @@
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from spypointapi import FileTokenStore, MemoryTokenStore, StoredToken
+
+
+class TestMemoryTokenStore(unittest.IsolatedAsyncioTestCase):
+
+    async def test_saves_token_per_account(self):
+        store = MemoryTokenStore()
+        token = StoredToken('token', datetime.now().replace(microsecond=0))
+
+        await store.save('user', token)
+
+        self.assertEqual(await store.load('user'), token)
+        self.assertIsNone(await store.load('other'))
+
+    async def test_lock_serializes_holders(self):
+        store = MemoryTokenStore()
+        events = []
+
+        async def hold(name):
+            async with store.lock('user'):
+                events.append(f'{name} in')
+                await asyncio.sleep(0.01)
+                events.append(f'{name} out')
+
+        await asyncio.gather(hold('first'), hold('second'))
+
+        self.assertEqual(events, ['first in', 'first out', 'second in', 'second out'])
+
+
+class TestFileTokenStore(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'tokens.json'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def test_shares_tokens_between_stores_on_same_file(self):
+        token = StoredToken('token', (datetime.now() + timedelta(hours=1)).replace(microsecond=0))
+
+        async with FileTokenStore(self.path).lock('user'):
+            await FileTokenStore(self.path).save('user', token)
+            await FileTokenStore(self.path).save('other', StoredToken('other', token.expires_at))
+
+        self.assertEqual(await FileTokenStore(self.path).load('user'), token)
+        self.assertEqual((await FileTokenStore(self.path).load('other')).token, 'other')
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o600)
+
+    async def test_loads_nothing_from_missing_or_corrupted_file(self):
+        self.assertIsNone(await FileTokenStore(self.path).load('user'))
+
+        self.path.write_text('{')
+
+        self.assertIsNone(await FileTokenStore(self.path).load('user'))
+
+    async def test_lock_excludes_other_stores_on_same_file(self):
+        events = []
+
+        async def hold(name):
+            async with FileTokenStore(self.path).lock('user'):
+                events.append(f'{name} in')
+                await asyncio.sleep(0.05)
+                events.append(f'{name} out')
+
+        await asyncio.gather(hold('first'), hold('second'))
+
+        self.assertIn(events, (['first in', 'first out', 'second in', 'second out'],
+                               ['second in', 'second out', 'first in', 'first out']))
@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from datetime import timedelta
+
+from spypointapi import TtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTtlCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.fetches = 0
+
+    async def fetch(self):
+        self.fetches += 1
+        return self.fetches
+
+    async def test_serves_cached_value_within_ttl(self):
+        cache = TtlCache(ttl=timedelta(seconds=10), clock=self.clock)
+
+        self.assertEqual(await cache.get('key', self.fetch), 1)
+        self.clock.now = 9
+        self.assertEqual(await cache.get('key', self.fetch), 1)
+
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    async def test_serves_stale_value_and_refreshes_in_background(self):
+        cache = TtlCache(ttl=timedelta(seconds=10), stale_while_revalidate=timedelta(seconds=10), clock=self.clock)
+
+        await cache.get('key', self.fetch)
+        self.clock.now = 15
+        self.assertEqual(await cache.get('key', self.fetch), 1)
+        await asyncio.sleep(0)
+        self.assertEqual(await cache.get('key', self.fetch), 2)
+
+        self.assertEqual(cache.stale_hits, 1)
+        self.assertEqual(cache.hits, 1)
+
+    async def test_fetches_again_once_stale_window_is_over(self):
+        cache = TtlCache(ttl=timedelta(seconds=10), stale_while_revalidate=timedelta(seconds=10), clock=self.clock)
+
+        await cache.get('key', self.fetch)
+        self.clock.now = 20
+
+        self.assertEqual(await cache.get('key', self.fetch), 2)
+        self.assertEqual(cache.misses, 2)
+
+    async def test_uses_ttl_per_key(self):
+        cache = TtlCache(ttl=timedelta(seconds=10), ttls={'short': timedelta(seconds=1)},
+                         stale_while_revalidate=timedelta(0), clock=self.clock)
+
+        await cache.get('short', self.fetch)
+        await cache.get('long', self.fetch)
+        self.clock.now = 5
+
+        self.assertEqual(await cache.get('short', self.fetch), 3)
+        self.assertEqual(await cache.get('long', self.fetch), 2)
+
+    async def test_invalidates_one_or_all_keys(self):
+        cache = TtlCache(clock=self.clock)
+        await cache.get('a', self.fetch)
+        await cache.get('b', self.fetch)
+
+        cache.invalidate('a')
+        self.assertEqual(await cache.get('a', self.fetch), 3)
+        self.assertEqual(await cache.get('b', self.fetch), 2)
+
+        cache.invalidate()
+        self.assertEqual(await cache.get('b', self.fetch), 4)
+
+    async def test_evicts_least_recently_used_entries(self):
+        cache = TtlCache(max_entries=2, clock=self.clock)
+        await cache.get('a', self.fetch)
+        await cache.get('b', self.fetch)
+        await cache.get('a', self.fetch)
+        await cache.get('c', self.fetch)
+
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(await cache.get('a', self.fetch), 1)
+        self.assertEqual(await cache.get('b', self.fetch), 4)